@@ -37,11 +37,10 @@ st.set_page_config(
 # Import services
 from services.auth_service import AuthService
 from database.db_manager import db_manager
+from database.init_db import ensure_database_exists
 
-# Import pages
-from pages.employee_dashboard import render_employee_dashboard
-from pages.admin_dashboard import render_admin_dashboard
-from pages.reports import render_reports_page
+# Pages are imported lazily in main(): the login screen never loads the
+# dashboard/report modules, and each role only imports the pages it opens
 
 # Import utilities
 from utils.constants import SessionKeys, UserRole, UIConstants
@@ -59,6 +58,19 @@ if hasattr(Config, 'LOG_LEVEL'):
 logger = get_logger(__name__)
 
 
+# ==================== Shared Services ====================
+
+@st.cache_resource
+def get_auth_service():
+    """
+    Create the AuthService once per process and share it across reruns/users.
+    
+    Returns:
+        AuthService: Shared, stateless authentication service
+    """
+    return AuthService()
+
+
 # ==================== Page Configuration ====================
 
 def configure_page():
@@ -181,7 +193,7 @@ def render_login_page():
                     return
                 
                 # Authenticate user
-                auth_service = AuthService()
+                auth_service = get_auth_service()
                 success, user, message = auth_service.authenticate(username, password)
                 
                 if success:
@@ -322,6 +334,8 @@ def main():
     Handles routing and page rendering based on authentication
     and user role.
     """
+    # First-run schema/seed (a single sentinel stat on warm starts)
+    ensure_database_exists()
       
     # Initialize session
     init_session_state()
@@ -344,16 +358,20 @@ def main():
         if user_role == UserRole.ADMIN.value:
             # Admin pages
             if selected_page == "Admin Dashboard":
+                from pages.admin_dashboard import render_admin_dashboard
                 render_admin_dashboard()
             elif selected_page == "Reports":
+                from pages.reports import render_reports_page
                 render_reports_page()
             elif selected_page == "System Info":
                 render_system_info()
         else:
             # Employee pages
             if selected_page == "Employee Dashboard":
+                from pages.employee_dashboard import render_employee_dashboard
                 render_employee_dashboard()
             elif selected_page == "Reports":
+                from pages.reports import render_reports_page
                 render_reports_page()
     
     except Exception as e:
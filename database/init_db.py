@@ -6,24 +6,38 @@ This module provides functions to:
 - Initialize database schema
 - Create default admin user
 - Seed initial data
+- Migrate legacy float money columns to integer minor units
+- Rebuild legacy summary/holiday tables onto their natural primary keys
+- Create a new SQLite schema from the committed database/seed.sql dump
 - Reset database (for development only)
 
 Usage:
     python database/init_db.py
+    
+    # Regenerate database/seed.sql after changing the models
+    python database/init_db.py --dump-seed
+    
+    # On app startup (cheap after the first successful run)
+    from database.init_db import ensure_database_exists
+    ensure_database_exists()
 """
 # ==================== Path Setup ====================
 # Add parent directory to Python path for imports
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # ==================== Imports ====================
 from datetime import date
+from typing import Optional
 import bcrypt
+from sqlalchemy import inspect, text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateTable
 
 from database.db_manager import db_manager
-from database.models import User, Holiday
+from database.models import User, Holiday, MonthlySummary
 from utils.constants import UserRole, DatabaseConstants
 from utils.logger import get_logger
 from config.config import Config
@@ -31,6 +45,42 @@ from config.config import Config
 # Initialize logger
 logger = get_logger(__name__)
 
+# Money columns stored as integer minor units: (table, column, scale)
+MONEY_COLUMNS = [
+    ('users', 'minute_cost', 4),
+    ('attendance', 'extra_expenses', 2),
+    ('monthly_summary', 'bonus', 2),
+    ('monthly_summary', 'salary', 2),
+]
+
+# SQLite PRAGMA user_version value marking the money migration as done
+MONEY_MIGRATION_VERSION = 1
+
+# SQLite PRAGMA user_version value marking the natural-key rebuild as done
+NATURAL_KEYS_MIGRATION_VERSION = 2
+
+# Latest schema version. Bump it with every model change or guarded migration
+# and regenerate database/seed.sql (--dump-seed); a dump carrying another
+# version is ignored on startup
+SCHEMA_VERSION = NATURAL_KEYS_MIGRATION_VERSION
+
+# Tables keyed on natural keys: (model table, legacy surrogate key column)
+NATURAL_KEY_TABLES = [
+    (MonthlySummary.__table__, 'summary_id'),
+    (Holiday.__table__, 'holiday_id'),
+]
+
+# Sentinel written after a successful first-run initialization.
+# Kept as a plain string so the warm-boot check is a single os.path.exists()
+INIT_SENTINEL = os.path.join(str(Config.DATA_DIR), ".initialized")
+
+# Schema-only SQL dump used to create a new SQLite database in one script
+SEED_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed.sql")
+SEED_VERSION_MARKER = "-- schema_version: "
+
+# Built once and reused: the seed path executes it as a single executemany
+HOLIDAY_INSERT = Holiday.__table__.insert()
+
 
 class DatabaseInitializer:
     """
@@ -45,7 +95,8 @@ class DatabaseInitializer:
         self.db = db_manager
         logger.info("DatabaseInitializer created")
     
-    def initialize_database(self, create_admin: bool = True, seed_holidays: bool = True):
+    def initialize_database(self, create_admin: bool = True, seed_holidays: bool = True,
+                            holiday_year: Optional[int] = None):
         """
         Initialize database with schema and initial data.
         
@@ -57,6 +108,7 @@ class DatabaseInitializer:
         Args:
             create_admin: Whether to create default admin user
             seed_holidays: Whether to seed holiday data
+            holiday_year: Year to seed holidays for (default: seed_default_holidays' year)
             
         Returns:
             bool: True if successful, False otherwise
@@ -69,6 +121,18 @@ class DatabaseInitializer:
             self.db.create_tables()
             logger.info("✓ Database tables created successfully")
             
+            # Step 1b: Convert legacy float money columns (no-op on new databases)
+            self.migrate_money_columns()
+            
+            # Step 1c: Add/backfill the attendance period key (no-op on new databases)
+            self.migrate_attendance_period()
+            
+            # Step 1d: Database-side audit timestamp defaults on existing tables
+            self.migrate_timestamp_defaults()
+            
+            # Step 1e: Natural primary keys on existing summary/holiday tables
+            self.migrate_natural_keys()
+            
             # Step 2: Create default admin user
             if create_admin:
                 logger.info("Creating default admin user...")
@@ -81,7 +145,10 @@ class DatabaseInitializer:
             # Step 3: Seed holiday data
             if seed_holidays:
                 logger.info("Seeding holiday data...")
-                holidays_count = self.seed_default_holidays()
+                if holiday_year is None:
+                    holidays_count = self.seed_default_holidays()
+                else:
+                    holidays_count = self.seed_default_holidays(holiday_year)
                 logger.info(f"✓ {holidays_count} holidays seeded successfully")
             
             logger.info("=" * 60)
@@ -94,6 +161,284 @@ class DatabaseInitializer:
             logger.error(f"Database initialization failed: {e}")
             return False
     
+    def migrate_money_columns(self) -> int:
+        """
+        Convert legacy Float money columns to integer minor units.
+        
+        Older databases stored minute_cost, extra_expenses, bonus and salary
+        as REAL/DOUBLE. The models now store them as exact integers
+        (see database.models.Money), so existing values are multiplied by
+        10^scale once:
+        - SQLite: UPDATE in place, guarded by PRAGMA user_version
+        - PostgreSQL: ALTER COLUMN ... TYPE INTEGER USING ROUND(col * factor)
+        
+        Safe to call on every startup - columns already declared as INTEGER
+        are skipped.
+        
+        Returns:
+            int: Number of columns migrated
+        """
+        engine = self.db.engine
+        migrated = 0
+        
+        try:
+            with engine.begin() as conn:
+                if Config.IS_SQLITE:
+                    user_version = conn.execute(text("PRAGMA user_version")).scalar() or 0
+                    if user_version >= MONEY_MIGRATION_VERSION:
+                        return 0
+                
+                # Inspect through the transaction's own connection: SQLite runs
+                # on a StaticPool, so an engine-level inspector would check out
+                # this same connection and roll back the UPDATEs issued so far
+                inspector = inspect(conn)
+                existing_tables = set(inspector.get_table_names())
+                
+                for table, column, scale in MONEY_COLUMNS:
+                    if table not in existing_tables:
+                        continue
+                    
+                    column_type = next(
+                        (str(c['type']).upper() for c in inspector.get_columns(table) if c['name'] == column),
+                        ''
+                    )
+                    if not any(t in column_type for t in ('FLOAT', 'REAL', 'DOUBLE')):
+                        continue
+                    
+                    factor = 10 ** scale
+                    logger.info(f"Migrating {table}.{column} to integer minor units (x{factor})")
+                    
+                    if Config.IS_SQLITE:
+                        conn.execute(text(
+                            f"UPDATE {table} SET {column} = CAST(ROUND({column} * {factor}) AS INTEGER) "
+                            f"WHERE {column} IS NOT NULL"
+                        ))
+                    else:
+                        conn.execute(text(
+                            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE INTEGER "
+                            f"USING ROUND({column} * {factor})::INTEGER"
+                        ))
+                    migrated += 1
+                
+                if Config.IS_SQLITE:
+                    conn.execute(text(f"PRAGMA user_version = {MONEY_MIGRATION_VERSION}"))
+            
+            if migrated:
+                logger.info(f"✓ Migrated {migrated} money columns to integer minor units")
+            return migrated
+            
+        except Exception as e:
+            logger.error(f"Money column migration failed: {e}")
+            raise
+    
+    def migrate_attendance_period(self) -> int:
+        """
+        Add and backfill the Attendance.period (YYYYMM) column.
+        
+        New inserts get the period from the model default; this covers
+        databases created before the column existed. Also makes sure the
+        (user_id, period) index is present.
+        
+        Returns:
+            int: Number of attendance rows backfilled
+        """
+        engine = self.db.engine
+        inspector = inspect(engine)
+        
+        if 'attendance' not in inspector.get_table_names():
+            return 0
+        
+        columns = {c['name'] for c in inspector.get_columns('attendance')}
+        
+        if Config.IS_SQLITE:
+            period_expr = "CAST(strftime('%Y%m', attendance_date) AS INTEGER)"
+        else:
+            period_expr = ("CAST(EXTRACT(YEAR FROM attendance_date) * 100 "
+                           "+ EXTRACT(MONTH FROM attendance_date) AS INTEGER)")
+        
+        try:
+            with engine.begin() as conn:
+                if 'period' not in columns:
+                    logger.info("Adding attendance.period column")
+                    conn.execute(text("ALTER TABLE attendance ADD COLUMN period INTEGER"))
+                
+                result = conn.execute(text(
+                    f"UPDATE attendance SET period = {period_expr} WHERE period IS NULL"
+                ))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_attendance_user_period "
+                    "ON attendance (user_id, period)"
+                ))
+            
+            backfilled = result.rowcount or 0
+            if backfilled:
+                logger.info(f"✓ Backfilled period for {backfilled} attendance rows")
+            return backfilled
+            
+        except Exception as e:
+            logger.error(f"Attendance period migration failed: {e}")
+            raise
+    
+    def migrate_timestamp_defaults(self) -> int:
+        """
+        Install server-side UTC defaults on existing audit columns.
+        
+        created_at/updated_at are filled by the database: ORM inserts inline
+        utcnow() into the statement, and new tables also carry it as a column
+        default for raw SQL. Tables created before that change have no column
+        default, so on PostgreSQL it is added with ALTER COLUMN ... SET
+        DEFAULT. SQLite cannot alter column defaults without rebuilding the
+        table, so it is skipped there; ORM inserts still get timestamps
+        through the inlined default.
+        
+        Returns:
+            int: Number of columns updated
+        """
+        if Config.IS_SQLITE:
+            return 0
+        
+        engine = self.db.engine
+        inspector = inspect(engine)
+        existing_tables = set(inspector.get_table_names())
+        updated = 0
+        
+        audit_columns = [
+            ('users', 'created_at'), ('users', 'updated_at'),
+            ('attendance', 'created_at'), ('attendance', 'updated_at'),
+            ('monthly_summary', 'created_at'),
+            ('holidays', 'created_at'),
+        ]
+        
+        try:
+            with engine.begin() as conn:
+                for table, column in audit_columns:
+                    if table not in existing_tables:
+                        continue
+                    
+                    info = next((c for c in inspector.get_columns(table) if c['name'] == column), None)
+                    if info is None or info.get('default'):
+                        continue
+                    
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} "
+                        f"SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP)"
+                    ))
+                    updated += 1
+            
+            if updated:
+                logger.info(f"✓ Added server-side defaults to {updated} audit columns")
+            return updated
+            
+        except Exception as e:
+            logger.error(f"Timestamp default migration failed: {e}")
+            raise
+    
+    def migrate_natural_keys(self) -> int:
+        """
+        Move existing monthly_summary/holidays tables onto their natural keys.
+        
+        MonthlySummary is keyed on (user_id, year, month) and Holiday on
+        holiday_date, both WITHOUT ROWID on SQLite. create_all() leaves
+        existing tables alone, so older databases still have the summary_id /
+        holiday_id surrogate keys:
+        - SQLite: rebuild the table (create the new layout under a temporary
+          name, INSERT ... SELECT the shared columns, drop the old table,
+          rename), guarded by PRAGMA user_version. The original table is only
+          dropped once its rows are copied.
+        - PostgreSQL: drop the surrogate column (and its primary key) and add
+          the natural primary key in place.
+        
+        Safe to call on every startup - tables already on the new layout are
+        skipped.
+        
+        Returns:
+            int: Number of tables migrated
+        """
+        engine = self.db.engine
+        migrated = 0
+        
+        try:
+            with engine.begin() as conn:
+                if Config.IS_SQLITE:
+                    user_version = conn.execute(text("PRAGMA user_version")).scalar() or 0
+                    if user_version >= NATURAL_KEYS_MIGRATION_VERSION:
+                        return 0
+                
+                # Same connection as the transaction (see migrate_money_columns)
+                inspector = inspect(conn)
+                existing_tables = set(inspector.get_table_names())
+                
+                for table, legacy_key in NATURAL_KEY_TABLES:
+                    if table.name not in existing_tables:
+                        continue
+                    
+                    if Config.IS_SQLITE:
+                        migrated += self._rebuild_sqlite_table(conn, inspector, table)
+                        continue
+                    
+                    columns = {c['name'] for c in inspector.get_columns(table.name)}
+                    if legacy_key not in columns:
+                        continue
+                    
+                    logger.info(f"Moving {table.name} to its natural primary key")
+                    pk_name = table.primary_key.name or f"{table.name}_pkey"
+                    pk_columns = ", ".join(c.name for c in table.primary_key.columns)
+                    conn.execute(text(f"ALTER TABLE {table.name} DROP COLUMN {legacy_key}"))
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} ADD CONSTRAINT {pk_name} PRIMARY KEY ({pk_columns})"
+                    ))
+                    migrated += 1
+                
+                if Config.IS_SQLITE:
+                    conn.execute(text(f"PRAGMA user_version = {NATURAL_KEYS_MIGRATION_VERSION}"))
+            
+            if migrated:
+                logger.info(f"✓ Moved {migrated} tables to natural primary keys")
+            return migrated
+            
+        except Exception as e:
+            logger.error(f"Natural key migration failed: {e}")
+            raise
+    
+    def _rebuild_sqlite_table(self, conn, inspector, table) -> int:
+        """
+        Rebuild one SQLite table with the model's current DDL, keeping its rows.
+        
+        Args:
+            conn: Connection of the running migration transaction
+            inspector: Inspector bound to conn
+            table: Model Table to rebuild
+            
+        Returns:
+            int: 1 if the table was rebuilt, 0 if it already is WITHOUT ROWID
+        """
+        create_sql = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {'name': table.name}
+        ).scalar() or ''
+        if 'WITHOUT ROWID' in create_sql.upper():
+            return 0
+        
+        logger.info(f"Rebuilding {table.name} on its natural primary key")
+        
+        old_columns = {c['name'] for c in inspector.get_columns(table.name)}
+        shared = ", ".join(c.name for c in table.columns if c.name in old_columns)
+        temp_name = f"_{table.name}_rebuild"
+        
+        # exec_driver_sql: the DDL is passed through verbatim (no bind parsing)
+        ddl = str(CreateTable(table).compile(conn)).replace(
+            f"CREATE TABLE {table.name} (", f"CREATE TABLE {temp_name} (", 1
+        )
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {temp_name}")
+        conn.exec_driver_sql(ddl)
+        conn.exec_driver_sql(f"INSERT INTO {temp_name} ({shared}) SELECT {shared} FROM {table.name}")
+        conn.exec_driver_sql(f"DROP TABLE {table.name}")
+        conn.exec_driver_sql(f"ALTER TABLE {temp_name} RENAME TO {table.name}")
+        for index in table.indexes:
+            index.create(conn)
+        
+        return 1
+    
     def create_default_admin(self, 
                            username: str = "admin", 
                            password: str = "admin123",
@@ -207,33 +552,35 @@ class DatabaseInitializer:
         
         try:
             with self.db.session_scope() as session:
-                for holiday_data in default_holidays:
-                    try:
-                        # Check if holiday already exists
-                        existing = session.query(Holiday).filter_by(
-                            holiday_date=holiday_data['date']
-                        ).first()
-                        
-                        if not existing:
-                            # Create new holiday
-                            holiday = Holiday(
-                                holiday_date=holiday_data['date'],
-                                holiday_name=holiday_data['name'],
-                                holiday_type=holiday_data['type']
-                            )
-                            session.add(holiday)
-                            created_count += 1
-                            logger.debug(f"Added holiday: {holiday_data['name']} on {holiday_data['date']}")
-                        else:
-                            logger.debug(f"Holiday already exists: {holiday_data['name']}")
-                            
-                    except IntegrityError:
-                        logger.warning(f"Duplicate holiday date: {holiday_data['date']}")
-                        continue
+                # Single lookup for dates that already exist
+                seed_dates = [h['date'] for h in default_holidays]
+                existing_dates = {
+                    row[0] for row in session.query(Holiday.holiday_date).filter(
+                        Holiday.holiday_date.in_(seed_dates)
+                    )
+                }
                 
-                session.flush()
+                new_rows = [
+                    {
+                        'holiday_date': h['date'],
+                        'holiday_name': h['name'],
+                        'holiday_type': h['type'],
+                    }
+                    for h in default_holidays
+                    if h['date'] not in existing_dates
+                ]
+                
+                if new_rows:
+                    # One executemany with the precompiled insert
+                    session.execute(HOLIDAY_INSERT, new_rows)
+                    created_count = len(new_rows)
+                
+                logger.debug(f"Skipped {len(existing_dates)} existing holidays")
                 logger.info(f"Successfully seeded {created_count} holidays")
                 
+        except IntegrityError as e:
+            logger.warning(f"Duplicate holiday date while seeding: {e}")
+            return 0
         except Exception as e:
             logger.error(f"Error seeding holidays: {e}")
             raise
@@ -339,6 +686,23 @@ class DatabaseInitializer:
             logger.error(f"Database reset failed: {e}")
             raise
     
+    def has_users(self) -> bool:
+        """
+        Check whether the users table exists and holds at least one row.
+        
+        Used by the startup path to tell a brand-new database (seed the
+        default admin and holidays) from an existing deployment (leave its
+        accounts and holiday edits alone).
+        
+        Returns:
+            bool: True if any user row exists, False otherwise
+        """
+        if 'users' not in inspect(self.db.engine).get_table_names():
+            return False
+        
+        with self.db.engine.connect() as conn:
+            return conn.execute(text("SELECT 1 FROM users LIMIT 1")).first() is not None
+    
     def check_database_status(self) -> dict:
         """
         Check database status and return statistics.
@@ -373,6 +737,156 @@ class DatabaseInitializer:
             return {}
 
 
+def _sqlite_db_path() -> Optional[str]:
+    """Return the SQLite file path from DATABASE_URL, or None for other backends"""
+    if not Config.IS_SQLITE:
+        return None
+    return Config.DATABASE_URL[len("sqlite:///"):]
+
+
+def build_seed_sql() -> str:
+    """
+    Render the models' SQLite schema as a SQL script (database/seed.sql).
+    
+    The schema is created by SQLAlchemy in a throwaway database and dumped
+    with sqlite3's iterdump(). Only the schema is dumped: the admin account
+    (bcrypt hash) and the holidays are seeded by DatabaseInitializer after
+    the restore, so nothing account- or year-specific is frozen in the file.
+    
+    Returns:
+        str: Dump text, headed by the SCHEMA_VERSION marker
+    """
+    import sqlite3
+    import tempfile
+    from sqlalchemy import create_engine
+    from database.models import Base
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = os.path.join(tmp_dir, "seed.db")
+        engine = create_engine(f"sqlite:///{tmp_path}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+        
+        conn = sqlite3.connect(tmp_path)
+        try:
+            lines = list(conn.iterdump())
+        finally:
+            conn.close()
+    
+    header = [
+        "-- Schema for a new SQLite database (restored by ensure_database_exists)",
+        "-- Generated by: python database/init_db.py --dump-seed",
+        f"{SEED_VERSION_MARKER}{SCHEMA_VERSION}",
+    ]
+    return "\n".join(header + lines) + "\n"
+
+
+def restore_seed_dump() -> bool:
+    """
+    Create the schema of a brand-new SQLite database from database/seed.sql.
+    
+    One executescript() with the stdlib sqlite3 module replaces the ORM DDL.
+    Only used when the database file does not exist yet (or is empty) and
+    the dump's schema version matches SCHEMA_VERSION; callers still run
+    DatabaseInitializer afterwards, so migrations (which also set PRAGMA
+    user_version, not kept by iterdump) and seeding behave as usual.
+    
+    Returns:
+        bool: True if the dump was restored, False if not applicable or failed
+    """
+    db_path = _sqlite_db_path()
+    if not db_path or not os.path.exists(SEED_SQL):
+        return False
+    if os.path.exists(db_path) and os.path.getsize(db_path) > 0:
+        return False
+    
+    import sqlite3
+    
+    try:
+        with open(SEED_SQL, encoding="utf-8") as f:
+            script = f.read()
+        
+        if f"{SEED_VERSION_MARKER}{SCHEMA_VERSION}\n" not in script:
+            logger.warning(f"Seed dump is not at schema version {SCHEMA_VERSION} - using the initializer")
+            return False
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.executescript(script)
+            conn.commit()
+        finally:
+            conn.close()
+        
+        logger.info(f"✓ Database schema restored from seed dump: {SEED_SQL}")
+        return True
+        
+    except Exception as e:
+        logger.error(f"Seed dump restore failed, falling back to initializer: {e}")
+        return False
+
+
+def ensure_database_exists() -> bool:
+    """
+    Initialize the database once per deployment.
+    
+    Warm boots return after a single os.path.exists() on the sentinel file.
+    On the first boot the schema/migration run happens under an exclusive
+    fcntl.flock on the sentinel, so when several workers start together only
+    one of them runs the DDL; the others wait and then see the sentinel.
+    
+    A new SQLite file gets its schema from database/seed.sql first; the
+    initializer then runs the migrations on every first boot. The default
+    admin and current-year holidays are only seeded when the users table is
+    empty (a brand-new database). Existing deployments without the sentinel
+    (upgrades, ephemeral containers on an external database) only get the
+    schema and migrations, so a renamed/deleted admin is never recreated.
+    
+    Returns:
+        bool: True if the database is (now) initialized, False on failure
+    """
+    # Fast path: already initialized
+    if os.path.exists(INIT_SENTINEL):
+        return True
+    
+    Config.ensure_directories_exist()
+    lock_path = INIT_SENTINEL + ".lock"
+    
+    try:
+        import fcntl
+    except ImportError:  # Windows: no flock, single-process dev server
+        fcntl = None
+    
+    with open(lock_path, "w") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            # Another worker may have finished while we waited for the lock
+            if os.path.exists(INIT_SENTINEL):
+                return True
+            
+            logger.info("First start detected - initializing database")
+            restore_seed_dump()
+            
+            initializer = DatabaseInitializer()
+            seed = not initializer.has_users()
+            if not seed:
+                logger.info("Existing users found - skipping admin/holiday seeding")
+            success = initializer.initialize_database(
+                create_admin=seed,
+                seed_holidays=seed,
+                holiday_year=date.today().year
+            )
+            
+            if success:
+                open(INIT_SENTINEL, "w").close()
+                logger.info(f"✓ Initialization sentinel written: {INIT_SENTINEL}")
+            return success
+            
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 def main():
     """
     Main function for command-line database initialization.
@@ -384,6 +898,12 @@ def main():
     print("Employee Check-in System - Database Initialization")
     print("=" * 60)
     
+    if "--dump-seed" in sys.argv[1:]:
+        with open(SEED_SQL, "w", encoding="utf-8") as f:
+            f.write(build_seed_sql())
+        print(f"\n✓ Seed dump written to {SEED_SQL}")
+        return
+    
     # Create initializer
     initializer = DatabaseInitializer()
     
@@ -395,6 +915,8 @@ def main():
     )
     
     if success:
+        Config.ensure_directories_exist()
+        open(INIT_SENTINEL, "w").close()
         print("\n✓ Database initialized successfully!")
         
         # Show database status
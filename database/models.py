@@ -12,18 +12,21 @@ Models:
     - Holiday: Public and company holidays
 """
 
-from datetime import datetime, date, time
+from collections import namedtuple
 from typing import Optional
 from sqlalchemy import (
-    Column, Integer, String, Float, Boolean, Date, Time, 
-    DateTime, Text, ForeignKey, CheckConstraint, UniqueConstraint
+    Column, Integer, String, Boolean, Date, Time, 
+    DateTime, Text, ForeignKey, CheckConstraint, UniqueConstraint,
+    PrimaryKeyConstraint, Index
 )
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from utils.logger import get_logger
 from utils.constants import UserRole, DayType, WorkHours, DatabaseConstants
-import pytz #fix to pound any timezone in DB to UTC and UI to Cairo
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -32,6 +35,93 @@ logger = get_logger(__name__)
 Base = declarative_base()
 
 
+#fix to pound any timezone in DB to UTC and UI to Cairo: every audit
+# timestamp (created_at/updated_at) is written through utcnow() below
+class utcnow(FunctionElement):
+    """
+    Database-side current UTC timestamp for audit column server defaults.
+    
+    Computed by the database, so inserts and bulk inserts don't call into
+    Python per row. SQLite's CURRENT_TIMESTAMP is already UTC; PostgreSQL
+    converts now() to UTC explicitly so the stored value doesn't depend on
+    the session time zone.
+    
+    Audit columns use it both as default= (inlined into the INSERT, so it
+    also works on legacy SQLite tables created without a column default)
+    and as server_default= (the DDL default for new tables and raw SQL).
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, 'postgresql')
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+def period_key(year: int, month: int) -> int:
+    """
+    Build the YYYYMM partition key used by Attendance.period.
+    
+    Example:
+        >>> period_key(2025, 3)
+        202503
+    """
+    return year * 100 + month
+
+
+def _attendance_period_default(context) -> Optional[int]:
+    """Derive Attendance.period from attendance_date at insert time"""
+    attendance_date = context.get_current_parameters().get('attendance_date')
+    if attendance_date is None:
+        return None
+    return period_key(attendance_date.year, attendance_date.month)
+
+
+# ==================== Custom Column Types ====================
+class Money(TypeDecorator):
+    """
+    Fixed-point money column stored as integer minor units.
+    
+    Amounts are kept in the database as exact integers (piastres for
+    scale=2) and exposed to Python as plain floats, so services and pages
+    keep working with the same float API while the stored values no longer
+    carry IEEE-754 rounding noise.
+    
+    Args:
+        scale: Number of decimal places kept (2 = piastres, 4 for per-minute rates)
+        
+    Example:
+        >>> bonus = Column(Money(), default=0.0)
+        >>> # 1250.75 EGP is stored as 125075
+    """
+    
+    impl = Integer
+    cache_ok = True
+    
+    def __init__(self, scale: int = 2, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scale = scale
+        self.factor = 10 ** scale
+    
+    def process_bind_param(self, value, dialect):
+        """Convert EGP amount to integer minor units on write"""
+        if value is None:
+            return None
+        return int(round(float(value) * self.factor))
+    
+    def process_result_value(self, value, dialect):
+        """Convert integer minor units back to EGP amount on read"""
+        if value is None:
+            return None
+        return round(value / self.factor, self.scale)
+
+
 class User(Base):
     """
     User model representing employees and administrators.
@@ -54,6 +144,8 @@ class User(Base):
     """
     
     __tablename__ = 'users'
+    # Fetch server-generated timestamps in the INSERT/UPDATE (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
     
     # ==================== Primary Key ====================
     user_id = Column(
@@ -71,11 +163,12 @@ class User(Base):
         comment="Unique username for login"
     )
     
-    password_hash = Column(
+    # Deferred: only the auth paths read it, and they do so inside a session
+    password_hash = deferred(Column(
         String(255), 
         nullable=False,
         comment="Bcrypt hashed password"
-    )
+    ))
     
     # ==================== Personal Information ====================
     full_name = Column(
@@ -94,9 +187,9 @@ class User(Base):
     
     # ==================== Employment Details ====================
     minute_cost = Column(
-        Float, 
+        Money(scale=4), 
         default=0.0,
-        comment="Cost per minute in EGP for salary calculation"
+        comment="Cost per minute in EGP for salary calculation (stored in 1/10000 EGP)"
     )
     
     vacation_days_allowed = Column(
@@ -121,14 +214,16 @@ class User(Base):
     # ==================== Audit Fields ====================
     created_at = Column(
         DateTime, 
-        default=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
+        default=utcnow(),
+        server_default=utcnow(),
         comment="Record creation timestamp (UTC)"
     )
     
     updated_at = Column(
         DateTime, 
-        default=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
-        onupdate=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         comment="Record last update timestamp"
     )
     
@@ -193,6 +288,17 @@ class User(Base):
         return self.role == UserRole.ADMIN.value
 
 
+# Plain, picklable snapshot of an Attendance row (same attribute names).
+# Safe to keep in st.cache_data: reading it never needs a session, so there
+# is no lazy/deferred load that could raise DetachedInstanceError.
+AttendanceRow = namedtuple(
+    'AttendanceRow',
+    ['attendance_id', 'user_id', 'attendance_date', 'check_in_time',
+     'check_out_time', 'total_working_minutes', 'overtime_minutes',
+     'extra_expenses', 'comments', 'day_type', 'is_late', 'period']
+)
+
+
 class Attendance(Base):
     """
     Attendance model for daily check-in/check-out records.
@@ -212,11 +318,14 @@ class Attendance(Base):
         comments: Employee comments
         day_type: Type of day (working_day, holiday, vacation, etc.)
         is_late: Flag indicating if check-in was after 9:30
+        period: YYYYMM partition key derived from attendance_date (indexed)
         created_at: Record creation timestamp
         updated_at: Record last update timestamp
     """
     
     __tablename__ = 'attendance'
+    # Fetch server-generated timestamps in the INSERT/UPDATE (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
     
     # ==================== Primary Key ====================
     attendance_id = Column(
@@ -269,16 +378,18 @@ class Attendance(Base):
     
     # ==================== Additional Information ====================
     extra_expenses = Column(
-        Float, 
+        Money(), 
         default=0.0,
-        comment="Extra expenses for the day in EGP"
+        comment="Extra expenses for the day in EGP (stored in piastres)"
     )
     
-    comments = Column(
+    # Deferred: list/aggregate queries skip the free-form TEXT column.
+    # Queries that hand detached records to the UI use undefer(Attendance.comments).
+    comments = deferred(Column(
         Text,
         nullable=True,
         comment="Employee comments or notes"
-    )
+    ))
     
     # ==================== Day Classification ====================
     day_type = Column(
@@ -293,17 +404,28 @@ class Attendance(Base):
         comment="True if checked in after 9:30 AM"
     )
     
+    # ==================== Partition Key ====================
+    # Monthly reports filter on (user_id, period) instead of a date range scan
+    period = Column(
+        Integer,
+        default=_attendance_period_default,
+        nullable=True,
+        comment="YYYYMM derived from attendance_date"
+    )
+    
     # ==================== Audit Fields ====================
     created_at = Column(
         DateTime, 
-        default=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
+        default=utcnow(),
+        server_default=utcnow(),
         comment="Record creation timestamp"
     )
     
     updated_at = Column(
         DateTime, 
-        default=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo 
-        onupdate=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
+        default=utcnow(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         comment="Record last update timestamp"
     )
     
@@ -322,6 +444,8 @@ class Attendance(Base):
             'attendance_date',
             name='unique_user_date'
         ),
+        # Monthly lookups: WHERE user_id = :uid AND period = :yyyymm
+        Index('ix_attendance_user_period', 'user_id', 'period'),
         # Validate day type
         CheckConstraint(
             f"day_type IN ("
@@ -366,6 +490,24 @@ class Attendance(Base):
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
     
+    def to_row(self) -> AttendanceRow:
+        """
+        Snapshot this record as a plain AttendanceRow.
+        
+        Must be called while the deferred comments column is loaded (queries
+        that hand records to the UI use undefer(Attendance.comments)).
+        
+        Returns:
+            AttendanceRow: Attendance data with the model's attribute names
+        """
+        return AttendanceRow(
+            self.attendance_id, self.user_id, self.attendance_date,
+            self.check_in_time, self.check_out_time,
+            self.total_working_minutes, self.overtime_minutes,
+            self.extra_expenses, self.comments, self.day_type,
+            self.is_late, self.period,
+        )
+    
     def has_checked_in(self) -> bool:
         """Check if user has checked in for this record"""
         return self.check_in_time is not None
@@ -386,11 +528,14 @@ class MonthlySummary(Base):
     This model stores pre-calculated monthly statistics for each employee,
     including working days, overtime, bonus, and salary calculations.
     
+    The natural key (user_id, year, month) is the primary key and, on SQLite,
+    the table is created WITHOUT ROWID so rows are clustered on that key
+    instead of being stored in a rowid b-tree plus a separate unique index.
+    
     Attributes:
-        summary_id: Primary key, auto-incrementing
-        user_id: Foreign key to User table
-        month: Month number (1-12)
-        year: Year
+        user_id: Foreign key to User table (primary key part)
+        month: Month number (1-12) (primary key part)
+        year: Year (primary key part)
         working_days: Number of days worked
         absence_days: Number of days absent
         total_working_hours: Total hours worked
@@ -402,14 +547,8 @@ class MonthlySummary(Base):
     """
     
     __tablename__ = 'monthly_summary'
-    
-    # ==================== Primary Key ====================
-    summary_id = Column(
-        Integer, 
-        primary_key=True, 
-        autoincrement=True,
-        comment="Unique monthly summary identifier"
-    )
+    # Fetch server-generated timestamps in the INSERT/UPDATE (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
     
     # ==================== Foreign Keys ====================
     user_id = Column(
@@ -466,21 +605,22 @@ class MonthlySummary(Base):
     
     # ==================== Financial Calculations ====================
     bonus = Column(
-        Float, 
+        Money(), 
         default=0.0,
-        comment="Calculated bonus in EGP (can be negative for penalties)"
+        comment="Calculated bonus in EGP, stored in piastres (can be negative for penalties)"
     )
     
     salary = Column(
-        Float, 
+        Money(), 
         default=0.0,
-        comment="Total calculated salary in EGP"
+        comment="Total calculated salary in EGP (stored in piastres)"
     )
     
     # ==================== Audit Fields ====================
     created_at = Column(
         DateTime, 
-        default=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
+        default=utcnow(),
+        server_default=utcnow(),
         comment="Record creation timestamp"
     )
     
@@ -493,12 +633,12 @@ class MonthlySummary(Base):
     
     # ==================== Constraints ====================
     __table_args__ = (
-        # Ensure one summary per user per month
-        UniqueConstraint(
+        # Natural key: one summary per user per month (clustered on SQLite)
+        PrimaryKeyConstraint(
             'user_id', 
-            'month', 
-            'year',
-            name='unique_user_month_year'
+            'year', 
+            'month',
+            name='pk_monthly_summary'
         ),
         # Validate month range
         CheckConstraint(
@@ -519,11 +659,12 @@ class MonthlySummary(Base):
             'absence_days >= 0',
             name='check_absence_days_positive'
         ),
+        {'sqlite_with_rowid': False},
     )
     
     def __repr__(self):
         """String representation of MonthlySummary object"""
-        return (f"<MonthlySummary(id={self.summary_id}, user_id={self.user_id}, "
+        return (f"<MonthlySummary(user_id={self.user_id}, "
                 f"period={self.year}-{self.month:02d})>")
     
     def to_dict(self) -> dict:
@@ -534,7 +675,6 @@ class MonthlySummary(Base):
             dict: Monthly summary data as dictionary
         """
         return {
-            'summary_id': self.summary_id,
             'user_id': self.user_id,
             'month': self.month,
             'year': self.year,
@@ -555,32 +695,30 @@ class Holiday(Base):
     
     This model tracks all holidays to exclude them from working day calculations.
     
+    holiday_date is the primary key; on SQLite the table is created
+    WITHOUT ROWID so lookups by date hit the clustered key directly.
+    
     Attributes:
-        holiday_id: Primary key, auto-incrementing
-        holiday_date: Date of the holiday
+        holiday_date: Date of the holiday (primary key)
         holiday_name: Name or description of the holiday
         holiday_type: Type of holiday (public, company, etc.)
         created_at: Record creation timestamp
     """
     
     __tablename__ = 'holidays'
+    # Fetch server-generated timestamps in the INSERT/UPDATE (RETURNING)
+    __mapper_args__ = {'eager_defaults': True}
+    # Clustered on holiday_date (SQLite only; ignored by PostgreSQL)
+    __table_args__ = {'sqlite_with_rowid': False}
     
     # ==================== Primary Key ====================
-    holiday_id = Column(
-        Integer, 
-        primary_key=True, 
-        autoincrement=True,
-        comment="Unique holiday identifier"
-    )
-    
-    # ==================== Holiday Information ====================
     holiday_date = Column(
         Date, 
-        unique=True, 
-        nullable=False,
+        primary_key=True,
         comment="Date of the holiday"
     )
     
+    # ==================== Holiday Information ====================
     holiday_name = Column(
         String(100), 
         nullable=False,
@@ -596,13 +734,14 @@ class Holiday(Base):
     # ==================== Audit Fields ====================
     created_at = Column(
         DateTime, 
-        default=lambda: datetime.now(pytz.utc), #fix to pound any timezone in DB to UTC and UI to Cairo
+        default=utcnow(),
+        server_default=utcnow(),
         comment="Record creation timestamp"
     )
     
     def __repr__(self):
         """String representation of Holiday object"""
-        return f"<Holiday(id={self.holiday_id}, name='{self.holiday_name}', date={self.holiday_date})>"
+        return f"<Holiday(date={self.holiday_date}, name='{self.holiday_name}')>"
     
     def to_dict(self) -> dict:
         """
@@ -612,7 +751,6 @@ class Holiday(Base):
             dict: Holiday data as dictionary
         """
         return {
-            'holiday_id': self.holiday_id,
             'holiday_date': self.holiday_date.isoformat() if self.holiday_date else None,
             'holiday_name': self.holiday_name,
             'holiday_type': self.holiday_type,
@@ -0,0 +1,77 @@
+-- Schema for a new SQLite database (restored by ensure_database_exists)
+-- Generated by: python database/init_db.py --dump-seed
+-- schema_version: 2
+BEGIN TRANSACTION;
+CREATE TABLE attendance (
+	attendance_id INTEGER NOT NULL, 
+	user_id INTEGER NOT NULL, 
+	attendance_date DATE NOT NULL, 
+	check_in_time TIME, 
+	check_out_time TIME, 
+	total_working_minutes INTEGER, 
+	overtime_minutes INTEGER, 
+	extra_expenses INTEGER, 
+	comments TEXT, 
+	day_type VARCHAR(20), 
+	is_late BOOLEAN, 
+	period INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP, 
+	PRIMARY KEY (attendance_id), 
+	CONSTRAINT unique_user_date UNIQUE (user_id, attendance_date), 
+	CONSTRAINT check_day_type CHECK (day_type IN ('working_day', 'holiday', 'normal_vacation', 'sick_leave', 'absence')), 
+	CONSTRAINT check_expenses_positive CHECK (extra_expenses >= 0), 
+	FOREIGN KEY(user_id) REFERENCES users (user_id) ON DELETE CASCADE
+);
+CREATE TABLE holidays (
+	holiday_date DATE NOT NULL, 
+	holiday_name VARCHAR(100) NOT NULL, 
+	holiday_type VARCHAR(20), 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP, 
+	PRIMARY KEY (holiday_date)
+)
+ WITHOUT ROWID
+
+;
+CREATE TABLE monthly_summary (
+	user_id INTEGER NOT NULL, 
+	month INTEGER NOT NULL, 
+	year INTEGER NOT NULL, 
+	working_days INTEGER, 
+	absence_days INTEGER, 
+	total_working_hours INTEGER, 
+	total_working_minutes INTEGER, 
+	overtime_minutes INTEGER, 
+	bonus INTEGER, 
+	salary INTEGER, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP, 
+	CONSTRAINT pk_monthly_summary PRIMARY KEY (user_id, year, month), 
+	CONSTRAINT check_valid_month CHECK (month >= 1 AND month <= 12), 
+	CONSTRAINT check_valid_year CHECK (year >= 2020 AND year <= 2100), 
+	CONSTRAINT check_working_days_positive CHECK (working_days >= 0), 
+	CONSTRAINT check_absence_days_positive CHECK (absence_days >= 0), 
+	FOREIGN KEY(user_id) REFERENCES users (user_id) ON DELETE CASCADE
+)
+ WITHOUT ROWID
+
+;
+CREATE TABLE users (
+	user_id INTEGER NOT NULL, 
+	username VARCHAR(50) NOT NULL, 
+	password_hash VARCHAR(255) NOT NULL, 
+	full_name VARCHAR(100) NOT NULL, 
+	role VARCHAR(20) NOT NULL, 
+	minute_cost INTEGER, 
+	vacation_days_allowed INTEGER, 
+	join_date DATE NOT NULL, 
+	is_active BOOLEAN, 
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP, 
+	updated_at DATETIME DEFAULT CURRENT_TIMESTAMP, 
+	PRIMARY KEY (user_id), 
+	CONSTRAINT check_user_role CHECK (role IN ('employee', 'admin')), 
+	CONSTRAINT check_minute_cost_positive CHECK (minute_cost >= 0), 
+	CONSTRAINT check_vacation_days_positive CHECK (vacation_days_allowed >= 0), 
+	UNIQUE (username)
+);
+CREATE INDEX ix_attendance_user_period ON attendance (user_id, period);
+COMMIT;
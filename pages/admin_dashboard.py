@@ -17,21 +17,467 @@ Usage:
 """
 
 import streamlit as st
-from datetime import date, datetime, time
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import pandas as pd
 
 from services.admin_service import AdminService
 from services.auth_service import AuthService
-from services.report_service import ReportService
-from services.calculation_service import CalculationService
 from utils.helpers import CurrencyHelper
-from utils.constants import DayType, UserRole
+from utils.constants import DAY_TYPE_VALUES, UserRole
 from utils.logger import get_logger
+from pages.reports import clear_cached_employees, clear_cached_reports
 
 # Initialize logger
 logger = get_logger(__name__)
 
 
+# Day type choices built once (selectboxes and the month grid's SelectboxColumn)
+_DAY_TYPE_VALUES = DAY_TYPE_VALUES
+
+# Report dict key -> display column for the full report's monthly breakdown
+_MONTHLY_BREAKDOWN_COLUMNS = {
+    'Month': 'Month',
+    'working_days': 'Working Days',
+    'absence_days': 'Absence Days',
+    'working_hours': 'Working Time (Hrs)',
+    'working_minutes': 'Working Time (Min)',
+    'total_minutes': 'Total (min)',
+    'overtime_minutes': 'Overtime (min)',
+    'Minute Price (EGP)': 'Minute Price (EGP)',
+    'bonus': 'Bonus (EGP)',
+    'salary': 'Salary (EGP)',
+}
+
+# Month windows offered for the full report's breakdown (0 = all months)
+_FULL_REPORT_WINDOWS = (6, 12, 24, 0)
+
+# Report dict key -> display column for the all-employees monthly table
+_ALL_EMPLOYEES_COLUMNS = {
+    'user_name': 'Employee',
+    'actual_working_days': 'Working Days',
+    'absence_days': 'Absence Days',
+    'working_hours': 'Total Hours',
+    'working_minutes': 'Total Minutes',
+    'overtime_minutes': 'Overtime (min)',
+    'extra_expenses': 'Expenses (EGP)',
+    'bonus': 'Bonus (EGP)',
+    'salary': 'Salary (EGP)',
+}
+
+# Rows shown in the quick-add "Recent Entries" table before the "show all" expander
+_RECENT_ENTRIES_LIMIT = 50
+
+@lru_cache(maxsize=2)
+def _allowed_date_range_60days(today_ordinal):
+    """
+    Compute the 60-day entry window for a given day.
+    
+    Keyed on date.today().toordinal(), so every call within the same day
+    returns the cached tuple and the window rolls over at midnight.
+    
+    Args:
+        today_ordinal: Proleptic Gregorian ordinal of today
+        
+    Returns:
+        tuple: (min_date, max_date)
+    """
+    today = date.fromordinal(today_ordinal)
+    return today - timedelta(days=60), today
+
+
+@lru_cache(maxsize=2)
+def _allowed_edit_range(today_ordinal):
+    """
+    Calculate the allowed date range for editing overtime/expenses/comments.
+    
+    Keyed on date.today().toordinal() like _allowed_date_range_60days, so the
+    monthrange calls and branch logic run at most once per calendar day.
+    
+    Business Rule:
+    - If today is between 1st and 8th of current month:
+        → Can edit: ALL of previous month + ALL of current month
+    - If today is after 8th of current month:
+        → Can edit: ALL of current month + Days 1-8 of next month
+    
+    Args:
+        today_ordinal: Proleptic Gregorian ordinal of today
+    
+    Returns:
+        tuple: (
+            first_month_range: tuple(year, month, min_day, max_day),
+            second_month_range: tuple(year, month, min_day, max_day),
+            is_grace_period: bool (today is the 1st-8th),
+            first_month_name: str (e.g. "October 2025"),
+            second_month_name: str,
+            today: date the range was computed for
+        )
+    
+    Examples:
+        Today: Oct 25, 2025 (after 8th)
+        → Ranges: ((2025, 10, 1, 31), (2025, 11, 1, 8))
+        → Can edit: All October + Nov 1-8
+        
+        Today: Nov 5, 2025 (before 9th)
+        → Ranges: ((2025, 10, 1, 31), (2025, 11, 1, 30))
+        → Can edit: All October + All November
+        
+        Today: Nov 15, 2025 (after 8th)
+        → Ranges: ((2025, 11, 1, 30), (2025, 12, 1, 8))
+        → Can edit: All November + Dec 1-8
+    """
+    from calendar import monthrange
+    
+    today = date.fromordinal(today_ordinal)
+    current_year = today.year
+    current_month = today.month
+    current_day = today.day
+    
+    # Get current month range
+    _, last_day_current = monthrange(current_year, current_month)
+    current_month_range = (current_year, current_month, 1, last_day_current)
+    
+    # Determine if we're in the grace period (1st to 8th of month)
+    is_grace_period = current_day <= 8
+    if is_grace_period:
+        # Grace period: Can edit PREVIOUS month (all days) + CURRENT month (all days)
+        
+        # Calculate previous month
+        if current_month == 1:
+            prev_year = current_year - 1
+            prev_month = 12
+        else:
+            prev_year = current_year
+            prev_month = current_month - 1
+        
+        _, last_day_prev = monthrange(prev_year, prev_month)
+        first_range, second_range = (prev_year, prev_month, 1, last_day_prev), current_month_range
+    
+    else:
+        # Regular period: Can edit CURRENT month (all days) + NEXT month (days 1-8)
+        
+        # Calculate next month
+        if current_month == 12:
+            next_year = current_year + 1
+            next_month = 1
+        else:
+            next_year = current_year
+            next_month = current_month + 1
+        
+        first_range, second_range = current_month_range, (next_year, next_month, 1, 8)
+    
+    # Month headings, formatted once here instead of in every caller
+    first_month_name = date(first_range[0], first_range[1], 1).strftime('%B %Y')
+    second_month_name = date(second_range[0], second_range[1], 1).strftime('%B %Y')
+    
+    return first_range, second_range, is_grace_period, first_month_name, second_month_name, today
+
+
+# ==================== Shared Services ====================
+@st.cache_resource
+def _get_services():
+    """
+    Create the admin services once per process and share them across reruns/users.
+    
+    The services are stateless wrappers around the db_manager singleton,
+    so one instance of each is safe to share. AdminService already builds a
+    ReportService and a CalculationService internally; those same instances
+    are reused instead of constructing a second pair.
+    
+    Returns:
+        Tuple of (AdminService, AuthService, ReportService, CalculationService)
+    """
+    logger.debug("Creating shared admin services")
+    admin_service = AdminService()
+    return admin_service, AuthService(), admin_service.report_service, admin_service.calculator
+
+
+# ==================== Cached Data Helpers ====================
+# Module-level st.cache_data helpers so widget interactions reuse the last
+# DB result instead of re-querying on every Streamlit rerun. They return
+# plain picklable values (not ORM objects: attendance records are snapshotted
+# as AttendanceRow tuples) so caching doesn't hash/pickle SQLAlchemy state
+# and cached reads never hit a detached instance's lazy/deferred loaders.
+
+# Lightweight, picklable employee row (attribute access like the User model)
+EmployeeRow = namedtuple(
+    'EmployeeRow',
+    ['user_id', 'username', 'full_name', 'minute_cost',
+     'vacation_days_allowed', 'is_active', 'join_date']
+)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_get_all_employees() -> list:
+    """
+    Get active employees as EmployeeRow tuples (cached for 300s).
+    
+    Call _clear_employee_caches() after creating or updating
+    an employee so the next rerun sees the change.
+    """
+    return [
+        EmployeeRow(e.user_id, e.username, e.full_name, e.minute_cost,
+                    e.vacation_days_allowed, e.is_active, e.join_date)
+        for e in _get_services()[1].get_all_employees()
+    ]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_employees_and_options(with_at: bool = False) -> tuple:
+    """
+    Get employees plus the prebuilt selectbox labels and label -> user_id map (cached for 300s).
+    
+    The labels tuple is passed straight to st.selectbox, so reruns neither
+    rebuild the f-string labels nor re-list the map's keys.
+    
+    Args:
+        with_at: Label as "Full Name (@username)" instead of "Full Name (username)"
+        
+    Returns:
+        Tuple of (employees: list[EmployeeRow], labels: tuple[str], options_map: dict)
+    """
+    employees = _cached_get_all_employees()
+    fmt = "{} (@{})" if with_at else "{} ({})"
+    labels = tuple(fmt.format(e.full_name, e.username) for e in employees)
+    options_map = dict(zip(labels, (e.user_id for e in employees)))
+    return employees, labels, options_map
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_employees_by_id() -> dict:
+    """Get a user_id -> EmployeeRow lookup over the cached employee list (cached for 300s)"""
+    return {e.user_id: e for e in _cached_get_all_employees()}
+
+
+def _clear_employee_caches():
+    """Invalidate the cached employee list, lookup and selectbox options"""
+    _cached_get_all_employees.clear()
+    _cached_employees_and_options.clear()
+    _cached_employees_by_id.clear()
+    clear_cached_employees()
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_monthly_report(user_id: int, year: int, month: int) -> dict:
+    """
+    Get an employee's monthly report keyed by (user_id, year, month) (cached for 120s).
+    
+    Call _clear_report_caches() after any attendance change and
+    _clear_summary_caches() after a bonus, minute-cost or holiday change.
+    """
+    report = _get_services()[2].get_monthly_report(user_id, year, month)
+    if report:
+        report['attendance_records'] = [r.to_row() for r in report['attendance_records']]
+    return report
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_all_employees_report(year: int, month: int) -> list:
+    """
+    Get the monthly reports of all active employees in one call (cached for 30s).
+    
+    ReportService.get_all_employees_report is the canonical read path for
+    the overview/recent-entries panels; admin writes invalidate it right
+    away via _clear_summary_caches(). The short TTL only bounds staleness
+    from writes made in other sessions (employee check-ins/check-outs).
+    """
+    return _get_services()[2].get_all_employees_report(year, month)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_monthly_summaries_bulk(user_ids: tuple, year: int, month: int) -> dict:
+    """Get {user_id: monthly figures} for the given employees in one batch (cached for 60s)"""
+    return _get_services()[2].get_monthly_summaries_bulk(list(user_ids), year, month)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_full_report(user_id: int) -> dict:
+    """Get an employee's full-history report keyed by user_id (cached for 300s)"""
+    return _get_services()[2].get_full_report(user_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_holidays() -> list:
+    """
+    Get all holidays as (holiday_date, holiday_name) rows (cached for 300s).
+    
+    Call _cached_holidays.clear() after adding or removing a holiday.
+    """
+    return [(h.holiday_date, h.holiday_name) for h in _get_services()[3].get_all_holidays()]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_monthly_breakdown_df(user_id: int) -> pd.DataFrame:
+    """
+    Get the full report's monthly breakdown as a display-ready DataFrame (cached for 300s).
+    
+    Built straight from the service's dicts: Month and Minute Price are
+    derived column-wise and money stays numeric (formatted by column_config).
+    Cleared with _cached_full_report, so the selectbox and window changes
+    only slice the cached frame.
+    """
+    report = _cached_full_report(user_id)
+    summaries = pd.DataFrame.from_records(report.get('monthly_summaries', []) if report else [])
+    if summaries.empty:
+        return pd.DataFrame(columns=list(_MONTHLY_BREAKDOWN_COLUMNS.values()))
+    summaries['Month'] = summaries['month_name'] + ' ' + summaries['year'].astype(str)
+    summaries['Minute Price (EGP)'] = report['minute_cost']
+    return summaries[list(_MONTHLY_BREAKDOWN_COLUMNS)].rename(columns=_MONTHLY_BREAKDOWN_COLUMNS)
+
+
+def _format_time_column(values) -> pd.Series:
+    """Format a column of datetime.time values as HH:MM in one pass ('N/A' for missing)"""
+    times = pd.Series(values, dtype=object)
+    return times.astype(str).str[:5].where(times.notna(), 'N/A')
+
+
+@lru_cache(maxsize=512)
+def _format_attendance_title(date_ordinal: int) -> str:
+    """Format a day as "YYYY-MM-DD Weekday"; memoized because the same ~60 days repeat every rerun"""
+    return date.fromordinal(date_ordinal).strftime('%Y-%m-%d %A')
+
+
+@lru_cache(maxsize=64)
+def _format_long_date(date_ordinal: int) -> str:
+    """Format a day as "Month DD, YYYY" for the date-range banners; memoized per day"""
+    return date.fromordinal(date_ordinal).strftime('%B %d, %Y')
+
+
+def _records_to_df(records) -> pd.DataFrame:
+    """
+    Materialize attendance records column-wise (SoA) into a DataFrame.
+    
+    Walks the records once to fill per-column lists; dates come from the
+    memoized _format_attendance_title(). Check times stay datetime.time so the
+    month grid can edit them (st.column_config.TimeColumn formats client-side).
+    
+    Args:
+        records: AttendanceRow snapshots (or Attendance objects)
+        
+    Returns:
+        DataFrame with id, date, check_in, check_out, worked, overtime,
+        day_type and is_late columns
+    """
+    columns = {
+        'id': [], 'date': [], 'check_in': [], 'check_out': [],
+        'worked': [], 'overtime': [], 'day_type': [], 'is_late': [],
+    }
+    for r in records:
+        columns['id'].append(r.attendance_id)
+        columns['date'].append(_format_attendance_title(r.attendance_date.toordinal()))
+        columns['check_in'].append(r.check_in_time)
+        columns['check_out'].append(r.check_out_time)
+        columns['worked'].append(r.total_working_minutes)
+        columns['overtime'].append(r.overtime_minutes)
+        columns['day_type'].append(r.day_type)
+        columns['is_late'].append(bool(r.is_late))
+    
+    df = pd.DataFrame(columns)
+    df['check_in'] = df['check_in'].astype(object)
+    df['check_out'] = df['check_out'].astype(object)
+    # A handful of day types repeated per row: Arrow ships them dictionary-encoded;
+    # every DayType is a category so the grid's selectbox offers all of them
+    df['day_type'] = pd.Categorical(df['day_type'], categories=_DAY_TYPE_VALUES)
+    return df
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_month_records_df(user_id: int, year: int, month: int) -> pd.DataFrame:
+    """Get a month's attendance records as the manage-attendance grid's DataFrame (cached for 120s)"""
+    report = _cached_monthly_report(user_id, year, month)
+    return _records_to_df(report.get('attendance_records', []) if report else [])
+
+
+def _changed_mask(new: pd.Series, old: pd.Series) -> pd.Series:
+    """Elementwise "value changed" for object columns, treating None == None as unchanged"""
+    return new.ne(old) & ~(new.isna() & old.isna())
+
+
+def _build_recent_entries_df(all_reports: list) -> pd.DataFrame:
+    """
+    Build the quick-add "Recent Entries" table from the all-employees reports.
+    
+    Built straight from the report dicts (only the needed keys), sorted most
+    active first, then converted to Arrow-backed dtypes so st.dataframe's
+    Arrow serialization passes the columns through without boxing. Hours
+    stay numeric; the column config formats them.
+    """
+    df = pd.DataFrame(
+        all_reports,
+        columns=['user_name', 'actual_working_days', 'absence_days', 'working_hours']
+    ).rename(columns={
+        'user_name': 'Employee',
+        'actual_working_days': 'Working Days',
+        'absence_days': 'Absence Days',
+    })
+    df['Total Hours'] = df.pop('working_hours').astype(float)
+    # Sort on the NumPy dtypes, before the Arrow conversion
+    df = df.sort_values('Working Days', ascending=False, kind='stable')
+    return df.convert_dtypes(dtype_backend='pyarrow')
+
+
+# Columns the daily adjustments editor actually shows/edits
+_ADJUSTMENT_FIELDS = (
+    'attendance_id', 'attendance_date', 'day_type', 'check_in_time', 'check_out_time',
+    'is_late', 'total_working_minutes', 'overtime_minutes', 'extra_expenses', 'comments',
+)
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_attendance_between(user_id: int, start_date: date, end_date: date,
+                               fields: tuple) -> list:
+    """Get a column projection of attendance rows in [start_date, end_date) (cached for 120s)"""
+    return _get_services()[2].get_attendance_between(user_id, start_date, end_date, fields)
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_adjustment_rows_by_month(user_id: int, start_date: date, end_date: date) -> dict:
+    """
+    Get the editable window's adjustment rows grouped by (year, month) (cached for 120s).
+    
+    One pass over the range result; the page and each month editor then
+    just look up their month instead of re-filtering the whole window.
+    """
+    by_month = {}
+    for row in _cached_attendance_between(user_id, start_date, end_date, _ADJUSTMENT_FIELDS):
+        day = row['attendance_date']
+        by_month.setdefault((day.year, day.month), []).append(row)
+    return by_month
+
+
+def _clear_summary_caches():
+    """Invalidate cached salary/summary reports (bonus, minute cost, holiday changes)"""
+    _cached_monthly_report.clear()
+    _cached_all_employees_report.clear()
+    _cached_full_report.clear()
+    _cached_monthly_breakdown_df.clear()
+    _cached_monthly_summaries_bulk.clear()
+    clear_cached_reports()
+
+
+def _clear_report_caches():
+    """Invalidate every cached report, including attendance rows, after an attendance mutation"""
+    _clear_summary_caches()
+    _cached_attendance_between.clear()
+    _cached_adjustment_rows_by_month.clear()
+    _cached_month_records_df.clear()
+
+
+def _rerun_fragment(message: str):
+    """
+    Report a successful mutation made inside a fragment.
+    
+    The message goes to a toast (it survives the rerun) and only the
+    enclosing fragment reruns to show fresh data.
+    
+    Args:
+        message: Success message to show
+    """
+    st.toast(message, icon="✅")
+    st.rerun(scope="fragment")
+
+
 class AdminDashboard:
     """
     Admin dashboard interface.
@@ -44,85 +490,25 @@ class AdminDashboard:
     """
     
     def __init__(self):
-        """Initialize admin dashboard with required services"""
-        self.admin_service = AdminService()
-        self.auth_service = AuthService()
-        self.report_service = ReportService()
-        self.calculator = CalculationService()
+        """Initialize admin dashboard with the shared (cached) services"""
+        (self.admin_service, self.auth_service,
+         self.report_service, self.calculator) = _get_services()
+        # One clock read per script run, shared by every widget default and
+        # date range below (a new dashboard is built on each run)
+        self._today = date.today()
         logger.debug("AdminDashboard initialized")
     
     def _get_allowed_edit_range(self):
         """
         Calculate the allowed date range for editing overtime/expenses/comments.
         
-        Business Rule:
-        - If today is between 1st and 8th of current month:
-            → Can edit: ALL of previous month + ALL of current month
-        - If today is after 8th of current month:
-            → Can edit: ALL of current month + Days 1-8 of next month
+        Thin wrapper over the day-memoized _allowed_edit_range().
         
         Returns:
-            tuple: (
-                first_month_range: tuple(year, month, min_day, max_day) or None,
-                second_month_range: tuple(year, month, min_day, max_day)
-            )
-        
-        Examples:
-            Today: Oct 25, 2025 (after 8th)
-            → Returns: ((2025, 10, 1, 31), (2025, 11, 1, 8))
-            → Can edit: All October + Nov 1-8
-            
-            Today: Nov 5, 2025 (before 9th)
-            → Returns: ((2025, 10, 1, 31), (2025, 11, 1, 30))
-            → Can edit: All October + All November
-            
-            Today: Nov 15, 2025 (after 8th)
-            → Returns: ((2025, 11, 1, 30), (2025, 12, 1, 8))
-            → Can edit: All November + Dec 1-8
+            tuple: (first_range, second_range, is_grace_period,
+                    first_month_name, second_month_name, today)
         """
-        from datetime import timedelta
-        from calendar import monthrange
-        
-        today = date.today()
-        current_year = today.year
-        current_month = today.month
-        current_day = today.day
-        
-        # Get current month range
-        _, last_day_current = monthrange(current_year, current_month)
-        current_month_range = (current_year, current_month, 1, last_day_current)
-        
-        # Determine if we're in the grace period (1st to 8th of month)
-        if current_day <= 8:
-            # Grace period: Can edit PREVIOUS month (all days) + CURRENT month (all days)
-            
-            # Calculate previous month
-            if current_month == 1:
-                prev_year = current_year - 1
-                prev_month = 12
-            else:
-                prev_year = current_year
-                prev_month = current_month - 1
-            
-            _, last_day_prev = monthrange(prev_year, prev_month)
-            prev_month_range = (prev_year, prev_month, 1, last_day_prev)
-            
-            return prev_month_range, current_month_range
-        
-        else:
-            # Regular period: Can edit CURRENT month (all days) + NEXT month (days 1-8)
-            
-            # Calculate next month
-            if current_month == 12:
-                next_year = current_year + 1
-                next_month = 1
-            else:
-                next_year = current_year
-                next_month = current_month + 1
-            
-            next_month_range = (next_year, next_month, 1, 8)
-            
-            return current_month_range, next_month_range
+        return _allowed_edit_range(self._today.toordinal())
 
     def _get_allowed_date_range_60days(self):
         """
@@ -133,17 +519,8 @@ class AdminDashboard:
                 min_date: 60 days before today
                 max_date: Today
         """
-        from datetime import timedelta
-        
-        today = date.today()
-        
-        # Min date: 60 days back from today
-        min_date = today - timedelta(days=60)
-        
-        # Max date: Today (cannot add future dates)
-        max_date = today
-        
-        return min_date, max_date
+        # Min date: 60 days back from today; max date: today (no future dates)
+        return _allowed_date_range_60days(self._today.toordinal())
     
     def render(self):
         """
@@ -199,12 +576,18 @@ class AdminDashboard:
         st.header("👥 Employee Overview")
         
         # Get all employees
-        employees = self.auth_service.get_all_employees()
+        employees = _cached_get_all_employees()
         
         if not employees:
             st.info("No employees found")
             return
         
+        # One batched fetch for the current month, looked up per card
+        today = self._today
+        by_user = _cached_monthly_summaries_bulk(
+            tuple(emp.user_id for emp in employees), today.year, today.month
+        )
+        
         # Display employee cards
         for emp in employees:
             with st.expander(f"👤 {emp.full_name} (@{emp.username})"):
@@ -220,38 +603,59 @@ class AdminDashboard:
                     st.write(f"**Vacation Days:** {emp.vacation_days_allowed}")
                 
                 with col3:
-                    # Get current month summary
-                    today = date.today()
-                    report = self.report_service.get_monthly_report(emp.user_id, today.year, today.month)
+                    # Current month summary from the batched reports
+                    report = by_user.get(emp.user_id)
                     
                     if report:
                         st.write(f"**This Month:**")
                         st.write(f"Working Days: {report['actual_working_days']}")
                         st.write(f"Salary: {CurrencyHelper.format_currency(report['salary'])}")
     
+    def _select_employee(self, label: str = "Select Employee"):
+        """
+        Render the shared "select employee" picker and return the chosen user_id.
+        
+        One implementation for the manage attendance, adjustments/bonus,
+        employee settings and full report pages. The choice is kept in
+        session_state, so switching between these pages keeps the same
+        employee selected.
+        
+        Args:
+            label: Selectbox label
+            
+        Returns:
+            Selected user_id, or None (after a warning) when there are no employees
+        """
+        employees, emp_labels, emp_options = _cached_employees_and_options()
+        if not employees:
+            st.warning("No employees found")
+            return None
+        
+        remembered = st.session_state.get('admin_selected_user_id')
+        index = next((i for i, e in enumerate(employees) if e.user_id == remembered), 0)
+        selected_emp = st.selectbox(label, emp_labels, index=index)
+        user_id = emp_options[selected_emp]
+        st.session_state.admin_selected_user_id = user_id
+        return user_id
+    
     def _render_manage_attendance(self):
         """Render attendance management page"""
         st.header("📝 Manage Attendance Records")
         
         # Select employee
-        employees = self.auth_service.get_all_employees()
-        if not employees:
-            st.warning("No employees found")
+        user_id = self._select_employee()
+        if user_id is None:
             return
         
-        emp_options = {f"{e.full_name} ({e.username})": e.user_id for e in employees}
-        selected_emp = st.selectbox("Select Employee", list(emp_options.keys()))
-        user_id = emp_options[selected_emp]
-        
         # Select month
         col1, col2 = st.columns(2)
         with col1:
-            year = st.number_input("Year", min_value=2020, max_value=2100, value=date.today().year)
+            year = st.number_input("Year", min_value=2020, max_value=2100, value=self._today.year, key="att_year")
         with col2:
-            month = st.number_input("Month", min_value=1, max_value=12, value=date.today().month)
+            month = st.number_input("Month", min_value=1, max_value=12, value=self._today.month, key="att_month")
         
         # Get attendance records
-        report = self.report_service.get_monthly_report(user_id, year, month)
+        report = _cached_monthly_report(user_id, int(year), int(month))
         
         if not report or not report.get('attendance_records'):
             st.info("No attendance records for this month")
@@ -264,7 +668,7 @@ class AdminDashboard:
         min_date, max_date = self._get_allowed_date_range_60days()
         days_back = (max_date - min_date).days
         
-        st.info(f"📅 **Allowed Date Range:** {min_date.strftime('%B %d, %Y')} to {max_date.strftime('%B %d, %Y')} ({days_back} days)")
+        st.info(f"📅 **Allowed Date Range:** {_format_long_date(min_date.toordinal())} to {_format_long_date(max_date.toordinal())} ({days_back} days)")
         
         with st.form("create_attendance"):
             col1, col2 = st.columns(2)
@@ -272,7 +676,7 @@ class AdminDashboard:
             with col1:
                 new_date = st.date_input(
                     "Date*", 
-                    value=date.today(),
+                    value=self._today,
                     min_value=min_date,
                     max_value=max_date,
                     help=f"Select a date within the last {days_back} days"
@@ -291,7 +695,7 @@ class AdminDashboard:
                 )
                 day_type = st.selectbox(
                     "Day Type*", 
-                    [dt.value for dt in DayType],
+                    _DAY_TYPE_VALUES,
                     help="Type of day (working, vacation, etc.)"
                 )
             
@@ -300,12 +704,13 @@ class AdminDashboard:
             if submitted:
                 # Validate date is within range
                 if not (min_date <= new_date <= max_date):
-                    st.error(f"❌ Date must be between {min_date.strftime('%Y-%m-%d')} and {max_date.strftime('%Y-%m-%d')}")
+                    st.error(f"❌ Date must be between {min_date.isoformat()} and {max_date.isoformat()}")
                 else:
                     success, attendance, msg = self.admin_service.create_attendance_record(
                         user_id, new_date, check_in, check_out, day_type
                     )
                     if success:
+                        _clear_report_caches()
                         st.success(f"✅ {msg}")
                         # bugfix: remove redundant rerun
                         # part of branch: bug/fix_rerun_issue
@@ -317,67 +722,91 @@ class AdminDashboard:
         if report and report.get('attendance_records'):
             st.markdown("---")
             st.subheader(f"📅 Existing Records: {report['month_name']} {report['year']}")
-            
-            for record in report['attendance_records']:
-                with st.expander(f"📆 {record.attendance_date.strftime('%Y-%m-%d %A')}"):
-                    self._render_attendance_editor(record)
-            return
+            self._render_month_records_editor(user_id, int(year), int(month))
     
-    def _render_attendance_editor(self, record):
+    @st.fragment
+    def _render_month_records_editor(self, user_id: int, year: int, month: int):
         """
-        Render attendance record editor.
+        Render the month's attendance records as one editable grid.
+        
+        Check-in/check-out and day type are edited in place; "Save changes"
+        diffs the edited frame against the cached one and only calls
+        update_check_times / change_day_type for rows that actually changed.
+        Replaces the per-record editor (a selectbox, a form and a button per
+        selected row).
         
         Args:
-            record: Attendance record object
+            user_id: User ID
+            year: Year of the records
+            month: Month of the records
         """
-        col1, col2 = st.columns(2)
+        df = _cached_month_records_df(user_id, year, month)
+        if df.empty:
+            st.info("No attendance records for this month")
+            return
         
-        with col1:
-            st.write("**Current Values:**")
-            st.write(f"Check-In: {record.check_in_time.strftime('%H:%M') if record.check_in_time else 'N/A'}")
-            st.write(f"Check-Out: {record.check_out_time.strftime('%H:%M') if record.check_out_time else 'N/A'}")
-            st.write(f"Working Time: {record.total_working_minutes} min")
-            st.write(f"Overtime: {record.overtime_minutes} min")
-            st.write(f"Day Type: {record.day_type}")
-            st.write(f"Late: {'Yes' if record.is_late else 'No'}")
+        editor_key = f"manage_records_{user_id}_{year}_{month}"
+        edited = st.data_editor(
+            df,
+            key=editor_key,
+            num_rows="fixed",
+            hide_index=True,
+            use_container_width=True,
+            disabled=['id', 'date', 'worked', 'overtime', 'is_late'],
+            column_config={
+                'id': None,
+                'date': 'Date',
+                'check_in': st.column_config.TimeColumn('Check-In', format="HH:mm", step=60),
+                'check_out': st.column_config.TimeColumn('Check-Out', format="HH:mm", step=60),
+                'worked': st.column_config.NumberColumn('Working (min)', format="%d"),
+                'overtime': st.column_config.NumberColumn('Overtime (min)', format="%d"),
+                'day_type': st.column_config.SelectboxColumn('Day Type', options=_DAY_TYPE_VALUES, required=True),
+                'is_late': st.column_config.CheckboxColumn('Late'),
+            },
+        )
         
-        with col2:
-            st.write("**Modify:**")
-            
-            # Update times
-            with st.form(f"update_times_{record.attendance_id}"):
-                new_check_in = st.time_input("New Check-In", value=record.check_in_time)
-                new_check_out = st.time_input("New Check-Out", value=record.check_out_time)
-                
-                if st.form_submit_button("Update Times"):
-                    success, msg = self.admin_service.update_check_times(
-                        record.attendance_id, new_check_in, new_check_out
-                    )
-                    if success:
-                        st.success(msg)
-                        #bugfix: remove redundant rerun 
-                        # this fix is part of branch: bug/fix_rerun_issue
-                        # st.rerun()
-                    else:
-                        st.error(msg)
+        # Only rows the admin touched are compared (see _render_adjustments_editor)
+        editor_state = st.session_state.get(editor_key) or {}
+        dirty_positions = sorted(int(pos) for pos in editor_state.get("edited_rows", {}))
+        touched = edited.iloc[dirty_positions]
+        original = df.iloc[dirty_positions]
+        
+        times_changed = (_changed_mask(touched['check_in'], original['check_in'])
+                         | _changed_mask(touched['check_out'], original['check_out']))
+        type_changed = touched['day_type'].astype(object) != original['day_type'].astype(object)
+        
+        col_btn1, col_btn2 = st.columns([1, 4])
+        with col_btn1:
+            save_clicked = st.button("💾 Save changes", key=f"{editor_key}_save", type="primary")
+        with col_btn2:
+            changed_count = int((times_changed | type_changed).sum())
+            if changed_count:
+                st.caption(f"📝 {changed_count} row(s) changed")
+        
+        if save_clicked:
+            if not changed_count:
+                st.info("ℹ️ No changes detected")
+                return
             
-            # Update day type
-            new_day_type = st.selectbox(
-                "Day Type",
-                [dt.value for dt in DayType],
-                index=[dt.value for dt in DayType].index(record.day_type),
-                key=f"daytype_{record.attendance_id}"
-            )
+            failures = []
+            for idx in touched.index[times_changed.to_numpy()]:
+                success, msg = self.admin_service.update_check_times(
+                    int(touched.at[idx, 'id']), touched.at[idx, 'check_in'], touched.at[idx, 'check_out']
+                )
+                if not success:
+                    failures.append(f"{touched.at[idx, 'date']}: {msg}")
+            for idx in touched.index[type_changed.to_numpy()]:
+                success, msg = self.admin_service.change_day_type(
+                    int(touched.at[idx, 'id']), str(touched.at[idx, 'day_type'])
+                )
+                if not success:
+                    failures.append(f"{touched.at[idx, 'date']}: {msg}")
             
-            if st.button("Update Day Type", key=f"btn_daytype_{record.attendance_id}"):
-                success, msg = self.admin_service.change_day_type(record.attendance_id, new_day_type)
-                if success:
-                    st.success(msg)
-                    # bugfix: remove redundant rerun
-                    # fix is part of branch: bug/fix_rerun_issue
-                    # st.rerun()  # no needed - form submission auto-reruns
-                else:
-                    st.error(msg)
+            _clear_report_caches()
+            for failure in failures:
+                st.error(f"❌ {failure}")
+            if not failures:
+                _rerun_fragment(f"Saved changes for {changed_count} record(s)")
     
     
     # ======================= Adjust the method to include the overtime, expense, comment per day =======================   
@@ -387,22 +816,24 @@ class AdminDashboard:
         st.header("📝 Daily Adjustments & Bonus")
         
         # Select employee
-        employees = self.auth_service.get_all_employees()
-        if not employees:
-            st.warning("No employees found")
+        user_id = self._select_employee()
+        if user_id is None:
             return
         
-        emp_options = {f"{e.full_name} ({e.username})": e.user_id for e in employees}
-        selected_emp = st.selectbox("Select Employee", list(emp_options.keys()))
-        user_id = emp_options[selected_emp]
-        
-        # Two tabs: Daily Adjustments and Monthly Bonus
-        tab1, tab2 = st.tabs(["📝 Daily Adjustments (Overtime, Expenses & Comments)", "💰 Monthly Bonus"])
+        # Two sections: Daily Adjustments and Monthly Bonus. A radio (like the
+        # Full Reports selector) instead of st.tabs, which runs every tab's
+        # body on each rerun - only the visible section queries and builds frames
+        section = st.radio(
+            "Section",
+            ["📝 Daily Adjustments (Overtime, Expenses & Comments)", "💰 Monthly Bonus"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="overtime_bonus_section"
+        )
         
-        with tab1:
+        if section.startswith("📝"):
             self._render_daily_adjustments(user_id)
-        
-        with tab2:
+        else:
             self._render_bonus_setter(user_id)
 
     # ======================= New methods for daily adjustments =======================
@@ -421,16 +852,12 @@ class AdminDashboard:
         st.info("ℹ️ **Overtime**: Time adjustment (± minutes) | **Expenses**: Additional costs (EGP) | **Comment**: Reason/notes for adjustments")
         st.info("ℹ️ **Overtime**, **Expenses**, **Comment**: are editable up to 8th of the next month ONLY!")
         
-        # Get allowed edit range
-        first_range, second_range = self._get_allowed_edit_range()
+        # Get allowed edit range (one clock read; month names come pre-formatted)
+        (first_range, second_range, is_grace_period,
+         first_month_name, second_month_name, _today) = self._get_allowed_edit_range()
 
         # Display allowed range with clear messaging
-        first_month_name = date(first_range[0], first_range[1], 1).strftime('%B %Y')
-        second_month_name = date(second_range[0], second_range[1], 1).strftime('%B %Y')
-
-        # Determine message based on date range
-        today = date.today()
-        if today.day <= 8:
+        if is_grace_period:
             # Grace period message
             st.success(f"✅ **Editable Period (Grace Period):** All of {first_month_name} + All of {second_month_name}")
             st.info(f"📅 You're in the grace period (1st-8th). You can edit previous and current month records.")
@@ -439,179 +866,149 @@ class AdminDashboard:
             st.success(f"✅ **Editable Period:** All of {first_month_name} + {second_month_name} (days 1-8)")
             st.info(f"📅 Starting from 9th, you can only edit current month + first 8 days of next month.")
         
-        # Get attendance records for both months
-        all_records = []
-        today = date.today()
-
-        # First month records (always all days)
-        first_report = self.report_service.get_monthly_report(user_id, first_range[0], first_range[1])
-        if first_report and first_report.get('attendance_records'):
-            all_records.extend([
-                (record, first_month_name) 
-                for record in first_report['attendance_records']
-            ])
-
-        # Second month records (filter based on grace period)
-        second_report = self.report_service.get_monthly_report(user_id, second_range[0], second_range[1])
-        if second_report and second_report.get('attendance_records'):
-            if today.day <= 8:
-                # Grace period: Show ALL days of second month (current month)
-                all_records.extend([
-                    (record, second_month_name) 
-                    for record in second_report['attendance_records']
-                ])
-            else:
-                # Regular period: Show only days 1-8 of second month (next month)
-                all_records.extend([
-                    (record, second_month_name) 
-                    for record in second_report['attendance_records']
-                    if record.attendance_date.day <= 8
-                ])
-        
-        if not all_records:
+        # One range query for the whole editable window (projected columns only):
+        # first month from day 1 through the last allowed day of the second month
+        # (all days in the grace period, days 1-8 otherwise)
+        window = (
+            user_id,
+            date(first_range[0], first_range[1], 1),
+            date(second_range[0], second_range[1], second_range[3]) + timedelta(days=1),
+        )
+        by_month = _cached_adjustment_rows_by_month(*window)
+        has_first_month = (first_range[0], first_range[1]) in by_month
+        has_second_month = (second_range[0], second_range[1]) in by_month
+        
+        if not has_first_month and not has_second_month:
             st.info("No attendance records found in the editable period")
             return
         
        # Group records by month for better organization
         st.markdown("---")
 
-        first_month_records = [(r, m) for r, m in all_records if m == first_month_name]
-        second_month_records = [(r, m) for r, m in all_records if m == second_month_name]
-
         # Render first month
-        if first_month_records:
+        if has_first_month:
             st.subheader(f"📅 {first_month_name}")
-            for record, _ in first_month_records:
-                self._render_daily_adjustment_row(record)
+            self._render_adjustments_editor(window, (first_range[0], first_range[1]), f"adj_{user_id}_first")
 
         # Render second month
-        if second_month_records:
+        if has_second_month:
             st.markdown("---")
             # Dynamic heading based on grace period
-            if today.day <= 8:
+            if is_grace_period:
                 st.subheader(f"📅 {second_month_name} (Current Month - All Days)")
             else:
                 st.subheader(f"📅 {second_month_name} (Days 1-8 only)")
             
-            for record, _ in second_month_records:
-                self._render_daily_adjustment_row(record)
+            self._render_adjustments_editor(window, (second_range[0], second_range[1]), f"adj_{user_id}_second")
 
-    # ======================= New methods for daily adjustments in row view (clean UI) =======================
-    # this is added as part of branch: bug/fix_overtime_issue.
-    def _render_daily_adjustment_row(self, record):
+    @st.fragment
+    def _render_adjustments_editor(self, window: tuple, year_month: tuple, editor_key: str):
         """
-        Render a single row for editing overtime, expenses, and comments together.
-        Uses an expander to keep the UI clean while allowing detailed editing.
+        Render overtime, expenses and comments for many records in one st.data_editor.
+        
+        One editable grid replaces the per-record expander/inputs/button
+        widgets; "Apply changes" diffs the edited frame against the original
+        and only writes rows that actually changed.
         
         Args:
-            record: Attendance record object
+            window: (user_id, start_date, end_date) of the editable window; rows
+                are read from the cache inside the fragment so a fragment
+                rerun after saving shows the stored values
+            year_month: (year, month) of the window this editor shows
+            editor_key: Unique widget key for this editor
         """
-        # Build expander title with current values summary
-        date_str = record.attendance_date.strftime('%Y-%m-%d %A')
-        worked_str = f"{record.total_working_minutes} min"
-        
-        # Show indicators if there are adjustments
-        indicators = []
-        if record.overtime_minutes != 0:
-            indicators.append(f"⏱️ OT: {record.overtime_minutes:+d} min")
-        if record.extra_expenses != 0:
-            indicators.append(f"💰 Exp: {record.extra_expenses:.0f} EGP")
-        if record.comments:
-            indicators.append(f"💬 Has comment")
-        
-        title = f"📆 {date_str} | Worked: {worked_str}"
-        if indicators:
-            title += f" | {' | '.join(indicators)}"
-        
-        with st.expander(title, expanded=False):
-            # Display basic info
-            col_info1, col_info2 = st.columns(2)
-            with col_info1:
-                st.caption(f"**Day Type:** {record.day_type}")
-                st.caption(f"**Check-In:** {record.check_in_time.strftime('%H:%M') if record.check_in_time else 'N/A'}")
-            with col_info2:
-                st.caption(f"**Late:** {'Yes ⚠️' if record.is_late else 'No ✅'}")
-                st.caption(f"**Check-Out:** {record.check_out_time.strftime('%H:%M') if record.check_out_time else 'N/A'}")
-            
-            st.markdown("---")
-            
-            # Adjustments form
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                new_overtime = st.number_input(
-                    "⏱️ Overtime (minutes)",
-                    value=record.overtime_minutes,
-                    step=10,
-                    key=f"ot_{record.attendance_id}",
+        records = _cached_adjustment_rows_by_month(*window).get(tuple(year_month), [])
+        if not records:
+            st.info("No attendance records found")
+            return
+        
+        rows = pd.DataFrame.from_records(records, columns=list(_ADJUSTMENT_FIELDS))
+        base_df = pd.DataFrame({
+            'id': rows['attendance_id'],
+            'Date': rows['attendance_date'],
+            'Day': pd.to_datetime(rows['attendance_date']).dt.day_name(),
+            'Day Type': rows['day_type'].astype('category'),
+            'Check-In': _format_time_column(rows['check_in_time']),
+            'Check-Out': _format_time_column(rows['check_out_time']),
+            'Late': rows['is_late'].astype(bool),
+            'Worked (min)': rows['total_working_minutes'],
+            'Overtime (min)': rows['overtime_minutes'],
+            'Expenses (EGP)': rows['extra_expenses'],
+            'Comment': rows['comments'].fillna(""),
+        })
+        
+        edited = st.data_editor(
+            base_df,
+            key=editor_key,
+            num_rows="fixed",
+            hide_index=True,
+            use_container_width=True,
+            disabled=['id', 'Date', 'Day', 'Day Type', 'Check-In', 'Check-Out', 'Late', 'Worked (min)'],
+            column_config={
+                'id': None,
+                'Overtime (min)': st.column_config.NumberColumn(
+                    "⏱️ Overtime (min)", step=10, format="%d",
                     help="Positive = bonus time, Negative = penalty"
-                )
-            
-            with col2:
-                new_expenses = st.number_input(
-                    "💰 Extra Expenses (EGP)",
-                    value=record.extra_expenses,
-                    step=10.0,
-                    format="%.2f",
-                    key=f"exp_{record.attendance_id}",
+                ),
+                'Expenses (EGP)': st.column_config.NumberColumn(
+                    "💰 Expenses (EGP)", min_value=0.0, step=10.0, format="%.2f",
                     help="Additional expenses (taxi, meals, etc.)"
-                )
-            
-            # Comment field (full width)
-            current_comment = record.comments or ""
-            new_comment = st.text_area(
-                "💬 Comment / Reason",
-                value=current_comment,
-                height=80,
-                placeholder="Add notes explaining why overtime/expenses were added (e.g., 'Stayed late for urgent client meeting', 'Taxi fare to client site')...",
-                key=f"comment_{record.attendance_id}",
-                help="Document the reason for adjustments"
-            )
-            
-            # ✅ FIX: Calculate change flags BEFORE button, so they're available in entire scope
-            overtime_changed = new_overtime != record.overtime_minutes
-            expenses_changed = new_expenses != record.extra_expenses
-            comment_changed = new_comment.strip() != current_comment.strip()
+                ),
+                'Comment': st.column_config.TextColumn(
+                    "💬 Comment / Reason",
+                    help="Document the reason for adjustments"
+                ),
+            },
+        )
+        
+        # Dirty tracking: data_editor keeps the touched row positions in
+        # session_state, so untouched rows are never compared and an
+        # untouched grid skips the diff entirely
+        editor_state = st.session_state.get(editor_key) or {}
+        dirty_positions = sorted(int(pos) for pos in editor_state.get("edited_rows", {}))
+        
+        # Rows whose editable cells differ from the stored values
+        touched = edited.iloc[dirty_positions]
+        original = base_df.iloc[dirty_positions]
+        new_overtime = touched['Overtime (min)'].fillna(0)
+        new_expenses = touched['Expenses (EGP)'].fillna(0.0)
+        new_comment = touched['Comment'].fillna("").str.strip()
+        changed = touched[
+            (new_overtime != original['Overtime (min)'])
+            | (new_expenses != original['Expenses (EGP)'])
+            | (new_comment != original['Comment'].str.strip())
+        ]
+        
+        col_btn1, col_btn2 = st.columns([1, 4])
+        with col_btn1:
+            save_clicked = st.button("💾 Apply changes", key=f"{editor_key}_apply", type="primary")
+        with col_btn2:
+            if not changed.empty:
+                st.caption(f"📝 {len(changed)} row(s) changed")
+        
+        if save_clicked:
+            if changed.empty:
+                st.info("ℹ️ No changes detected")
+                return
             
-            # Save button
-            # bugfix for removing st.rerun() after save - part of branch: bug/fix_absence_Days_slary_calculations
-            col_btn1, col_btn2 = st.columns([1, 4])
-            with col_btn1:
-                save_clicked = st.button("💾 Save All", key=f"btn_save_{record.attendance_id}", type="primary")
-
-            # ✅ FIX: Process button click outside the column context
-            if save_clicked:
-                # Check if any values changed
-                if not overtime_changed and not expenses_changed and not comment_changed:
-                    st.info("ℹ️ No changes detected")
-                else:
-                    # Update all three fields at once
-                    success, msg = self.admin_service.update_daily_adjustments(
-                        record.attendance_id,
-                        new_overtime,
-                        new_expenses,
-                        new_comment.strip() if new_comment.strip() else None
-                    )
-                    
-                    if success:
-                        st.success(f"✅ {msg}")
-                        # ✅ NO st.rerun() needed - button click auto-reruns
-                    else:
-                        st.error(f"❌ {msg}")
+            # One transaction for all changed rows (all-or-nothing)
+            success, msg = self.admin_service.update_daily_adjustments_bulk([
+                (
+                    int(edited.at[idx, 'id']),
+                    int(new_overtime[idx]),
+                    float(new_expenses[idx]),
+                    new_comment[idx] or None,
+                )
+                for idx in changed.index
+            ])
             
-            with col_btn2:
-                # Show what will be updated (now variables are in scope!)
-                changes = []
-                if overtime_changed:
-                    changes.append(f"Overtime: {record.overtime_minutes} → {new_overtime}")
-                if expenses_changed:
-                    changes.append(f"Expenses: {record.extra_expenses:.0f} → {new_expenses:.0f} EGP")
-                if comment_changed:
-                    changes.append("Comment: Updated")
-                
-                if changes:
-                    st.caption("📝 Changes: " + " | ".join(changes))
+            if success:
+                _clear_report_caches()
+                _rerun_fragment(msg)
+            else:
+                st.error(f"❌ {msg}")
     
+    @st.fragment
     def _render_bonus_setter(self, user_id: int):
         """
         Render monthly bonus setter.
@@ -625,12 +1022,12 @@ class AdminDashboard:
         # Select month
         col1, col2 = st.columns(2)
         with col1:
-            year = st.number_input("Year", min_value=2020, max_value=2100, value=date.today().year, key="bonus_year")
+            year = st.number_input("Year", min_value=2020, max_value=2100, value=self._today.year, key="bonus_year")
         with col2:
-            month = st.number_input("Month", min_value=1, max_value=12, value=date.today().month, key="bonus_month")
+            month = st.number_input("Month", min_value=1, max_value=12, value=self._today.month, key="bonus_month")
         
         # Get current bonus
-        report = self.report_service.get_monthly_report(user_id, year, month)
+        report = _cached_monthly_report(user_id, int(year), int(month))
         current_bonus = report.get('bonus', 0.0) if report else 0.0
         
         # Bonus input
@@ -653,8 +1050,10 @@ class AdminDashboard:
         if submitted:
             success, msg = self.admin_service.update_bonus(user_id, year, month, new_bonus)
             if success:
-                st.success(msg)
+                # Bonus only changes the salary summaries, not attendance rows
+                _clear_summary_caches()
                 # ✅ NO st.rerun() needed - form submission auto-reruns
+                _rerun_fragment(msg)
             else:
                 st.error(msg)
     
@@ -663,17 +1062,13 @@ class AdminDashboard:
         st.header("⚙️ Employee Settings")
         
         # Select employee
-        employees = self.auth_service.get_all_employees()
-        if not employees:
-            st.warning("No employees found")
+        user_id = self._select_employee()
+        if user_id is None:
             return
         
-        emp_options = {f"{e.full_name} ({e.username})": e.user_id for e in employees}
-        selected_emp = st.selectbox("Select Employee", list(emp_options.keys()))
-        user_id = emp_options[selected_emp]
-        
-        # Get employee details
-        employee = self.auth_service.get_user_by_id(user_id)
+        # Get employee details from the cached roster (no per-rerun DB lookup;
+        # minute cost / vacation updates clear it via _clear_employee_caches)
+        employee = _cached_employees_by_id().get(user_id)
         
         if not employee:
             st.error("Employee not found")
@@ -698,6 +1093,8 @@ class AdminDashboard:
                 if st.form_submit_button("Update Minute Cost"):
                     success, msg = self.admin_service.update_minute_cost(user_id, new_cost)
                     if success:
+                        _clear_employee_caches()
+                        _clear_summary_caches()
                         st.success(msg)
                         # bugfix: remove redundant rerun
                         # part of branch: bug/fix_rerun_issue
@@ -720,6 +1117,7 @@ class AdminDashboard:
                 if st.form_submit_button("Update Vacation Days"):
                     success, msg = self.admin_service.update_vacation_allowance(user_id, new_days)
                     if success:
+                        _clear_employee_caches()
                         st.success(msg)
                         # bugfix: remove redundant rerun for updating employee_vacation balance
                         # part of branch: bug/fix_rerun_issue
@@ -727,36 +1125,93 @@ class AdminDashboard:
                     else:
                         st.error(msg)
     
+    def _apply_holiday_removals(self, editor_key: str, holiday_dates: tuple):
+        """
+        Remove the holidays ticked in the removal grid (submit callback).
+        
+        Streamlit runs callbacks before the script, so the rerun caused by the
+        submit already renders the updated list; feedback is handed over via
+        session state.
+        
+        Args:
+            editor_key: Session-state key of the removal data_editor
+            holiday_dates: Holiday dates in grid row order
+        """
+        edited_rows = st.session_state.get(editor_key, {}).get('edited_rows', {})
+        removed_dates = sorted(
+            holiday_dates[int(pos)] for pos, changes in edited_rows.items()
+            if changes.get('Remove')
+        )
+        
+        if not removed_dates:
+            st.session_state.holidays_remove_feedback = [('info', "ℹ️ No holidays selected")]
+            return
+        
+        removed, feedback = 0, []
+        for holiday_date in removed_dates:
+            success, msg = self.admin_service.remove_holiday(holiday_date)
+            if success:
+                removed += 1
+            else:
+                feedback.append(('error', msg))
+        
+        if removed:
+            _cached_holidays.clear()
+            _clear_summary_caches()
+            # Fresh editor key drops the applied deletions from widget state
+            st.session_state.holidays_editor_nonce += 1
+            feedback.insert(0, ('success', f"✅ Removed {removed} holiday(s)"))
+        st.session_state.holidays_remove_feedback = feedback
+    
+    @st.fragment
     def _render_holiday_management(self):
-        """Render holiday management page"""
+        """
+        Render holiday management page.
+        
+        Runs as a fragment: removing or adding a holiday reruns only this
+        section, not the sidebar and the rest of the dashboard.
+        """
         st.header("📆 Holiday Management")
         
         # Get all holidays
-        holidays = self.calculator.get_all_holidays()
+        holidays = _cached_holidays()
         
         # Display holidays
         st.subheader("Current Holidays")
         
         if holidays:
-            for holiday in holidays:
-                col1, col2, col3 = st.columns([2, 2, 1])
-                
-                with col1:
-                    st.write(f"**{holiday.holiday_date.strftime('%Y-%m-%d')}**")
-                
-                with col2:
-                    st.write(holiday.holiday_name)
-                
-                with col3:
-                    if st.button("🗑️ Remove", key=f"remove_{holiday.holiday_id}"):
-                        success, msg = self.admin_service.remove_holiday(holiday.holiday_date)
-                        if success:
-                            st.success(msg)
-                            # bugfix: remove redundant rerun
-                            # part of branch: bug/fix_rerun_issue
-                            # st.rerun()
-                        else:
-                            st.error(msg)
+            # One editor for all holidays (instead of 4 widgets per row);
+            # tick "Remove" on rows, then apply the removals in one shot
+            df = pd.DataFrame.from_records(holidays, columns=['Date', 'Holiday'])
+            df['Remove'] = False
+            editor_nonce = st.session_state.setdefault('holidays_editor_nonce', 0)
+            # Inside a form, ticking boxes doesn't rerun the script; the
+            # selection reaches the server once, on submit
+            editor_key = f"holidays_editor_{editor_nonce}"
+            with st.form(f"holiday_remove_form_{editor_nonce}"):
+                st.data_editor(
+                    df,
+                    key=editor_key,
+                    num_rows="fixed",
+                    disabled=['Date', 'Holiday'],
+                    hide_index=True,
+                    use_container_width=True,
+                    column_config={
+                        'Date': st.column_config.DateColumn('Date', format="YYYY-MM-DD"),
+                        'Remove': st.column_config.CheckboxColumn('🗑️ Remove', default=False),
+                    },
+                )
+                st.caption("Tick the holidays to remove, then click Apply. Use the form below to add holidays.")
+                # Removals run in the submit callback, before the rerun the
+                # submit triggers anyway, so that rerun already lists the result
+                st.form_submit_button(
+                    "🗑️ Apply removals",
+                    on_click=self._apply_holiday_removals,
+                    args=(editor_key, tuple(df['Date'])),
+                )
+            
+            for kind, text in st.session_state.pop('holidays_remove_feedback', []):
+                getattr(st, kind)(text)
         else:
             st.info("No holidays defined")
         
@@ -768,7 +1223,7 @@ class AdminDashboard:
             col1, col2 = st.columns(2)
             
             with col1:
-                holiday_date = st.date_input("Date", value=date.today())
+                holiday_date = st.date_input("Date", value=self._today)
             
             with col2:
                 holiday_name = st.text_input("Holiday Name", placeholder="e.g., National Day")
@@ -777,6 +1232,8 @@ class AdminDashboard:
                 if holiday_name:
                     success, msg = self.admin_service.add_holiday(holiday_date, holiday_name)
                     if success:
+                        _cached_holidays.clear()
+                        _clear_summary_caches()
                         st.success(msg)
                         # bugfix: remove redundant rerun
                         # part of branch: bug/fix_rerun_issue
@@ -785,6 +1242,43 @@ class AdminDashboard:
                         st.error(msg)
                 else:
                     st.warning("Please enter holiday name")
+        
+        # Several holidays at once (one transaction instead of one per submit)
+        with st.expander("📋 Add several holidays"):
+            with st.form("add_holidays_bulk_form"):
+                holidays_text = st.text_area(
+                    "One holiday per line: YYYY-MM-DD, Name",
+                    placeholder="2025-01-07, Coptic Christmas\n2025-04-25, Sinai Liberation Day",
+                )
+                
+                if st.form_submit_button("Add Holidays"):
+                    rows, invalid = [], []
+                    for line in holidays_text.splitlines():
+                        if not line.strip():
+                            continue
+                        date_part, _, name_part = line.partition(",")
+                        try:
+                            holiday_date = date.fromisoformat(date_part.strip())
+                        except ValueError:
+                            invalid.append(line.strip())
+                            continue
+                        if not name_part.strip():
+                            invalid.append(line.strip())
+                            continue
+                        rows.append((holiday_date, name_part.strip()))
+                    
+                    if invalid:
+                        st.error("❌ Invalid lines (expected YYYY-MM-DD, Name): " + "; ".join(invalid))
+                    elif not rows:
+                        st.warning("Please enter at least one holiday")
+                    else:
+                        success, msg = self.admin_service.add_holidays_bulk(rows)
+                        if success:
+                            _cached_holidays.clear()
+                            _clear_summary_caches()
+                            st.success(msg)
+                        else:
+                            st.error(msg)
     
     def _render_full_reports(self):
         """Render full reports page"""
@@ -802,22 +1296,25 @@ class AdminDashboard:
         else:
             self._render_all_employees_report()
     
+    @st.fragment
     def _render_single_employee_report(self):
-        """Render single employee full report"""
+        """Render single employee full report (fragment: picking an employee reruns only this report)"""
         st.subheader("👤 Employee Full Report")
         
         # Select employee
-        employees = self.auth_service.get_all_employees()
-        if not employees:
-            st.warning("No employees found")
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            user_id = self._select_employee()
+        if user_id is None:
             return
+        with col2:
+            st.write("")  # Align button with the selectbox
+            if st.button("🔄 Refresh", key="full_report_refresh", use_container_width=True):
+                _cached_full_report.clear()
+                _cached_monthly_breakdown_df.clear()
         
-        emp_options = {f"{e.full_name} ({e.username})": e.user_id for e in employees}
-        selected_emp = st.selectbox("Select Employee", list(emp_options.keys()))
-        user_id = emp_options[selected_emp]
-        
-        # Get full report
-        report = self.report_service.get_full_report(user_id)
+        # Get full report (cached per employee; unrelated reruns don't re-aggregate)
+        report = _cached_full_report(user_id)
         
         if not report:
             st.info("No data available")
@@ -832,92 +1329,90 @@ class AdminDashboard:
         st.markdown("---")
         st.subheader("📈 Cumulative Statistics")
         
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Working Days", report['cumulative_stats']['total_working_days'])
-        with col2:
-            st.metric("Total Hours", report['cumulative_stats']['total_working_hours'])
-        with col3:
-            st.metric("Total Bonus", CurrencyHelper.format_currency(report['cumulative_stats']['total_bonus']))
-        with col4:
-            st.metric("Total Salary", CurrencyHelper.format_currency(report['cumulative_stats']['total_salary']))
+        stats = report['cumulative_stats']
+        metrics = (
+            ("Total Working Days", stats['total_working_days']),
+            ("Total Hours", stats['total_working_hours']),
+            ("Total Bonus", CurrencyHelper.format_currency(stats['total_bonus'])),
+            ("Total Salary", CurrencyHelper.format_currency(stats['total_salary'])),
+        )
+        for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+            col.metric(label, value)
         
         # Display monthly summaries table
         st.markdown("---")
         st.subheader("📅 Monthly Breakdown")
         
         if report['monthly_summaries']:
-            data = []
-            for summary in report['monthly_summaries']:
-                data.append({
-                    'Month': f"{summary['month_name']} {summary['year']}",
-                    'Working Days': summary['working_days'],
-                    'Absence Days': summary['absence_days'],
-                    'Working Time (Hrs)': summary['working_hours'],
-                    'Working Time (Min)': summary['working_minutes'],
-                    'Total (min)': summary['total_minutes'],
-                    'Overtime (min)': summary['overtime_minutes'],
-                    'Minute Price (EGP)': report['minute_cost'],
-                    'Bonus (EGP)': f"{summary['bonus']:.2f}",
-                    'Salary (EGP)': f"{summary['salary']:.2f}"
-                })
+            # Window the history: only the months the admin reads are built
+            # and sent to the browser (summaries are ordered oldest first)
+            window = st.selectbox("Show last", _FULL_REPORT_WINDOWS, index=1,
+                                  format_func=lambda n: f"{n} months" if n else "All months",
+                                  key="full_report_window")
+            breakdown = _cached_monthly_breakdown_df(user_id)
+            df = breakdown.tail(window) if window else breakdown
+            if len(df) < len(breakdown):
+                st.caption(f"Showing the last {window} of {len(breakdown)} months")
             
-            df = pd.DataFrame(data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    col: st.column_config.NumberColumn(col, format="%.2f")
+                    for col in ('Bonus (EGP)', 'Salary (EGP)')
+                },
+            )
         else:
             st.info("No monthly data available")
     
+    @st.fragment
     def _render_all_employees_report(self):
-        """Render all employees report"""
+        """Render all employees report (fragment: changing the month reruns only this report)"""
         st.subheader("👥 All Employees Report")
         
         # Select month
         col1, col2 = st.columns(2)
         with col1:
-            year = st.number_input("Year", min_value=2020, max_value=2100, value=date.today().year)
+            year = st.number_input("Year", min_value=2020, max_value=2100, value=self._today.year, key="all_report_year")
         with col2:
-            month = st.number_input("Month", min_value=1, max_value=12, value=date.today().month)
+            month = st.number_input("Month", min_value=1, max_value=12, value=self._today.month, key="all_report_month")
         
         # Get reports for all employees
-        reports = self.report_service.get_all_employees_report(year, month)
+        reports = _cached_all_employees_report(int(year), int(month))
         
         if not reports:
             st.info("No data available")
             return
         
-        # Create summary table
-        data = []
-        for report in reports:
-            data.append({
-                'Employee': report['user_name'],
-                'Working Days': report['actual_working_days'],
-                'Absence Days': report['absence_days'],
-                'Total Hours': report['working_hours'],
-                'Total Minutes': report['working_minutes'],
-                'Overtime (min)': report['overtime_minutes'],
-                'Expenses (EGP)': f"{report['extra_expenses']:.2f}",
-                'Bonus (EGP)': f"{report['bonus']:.2f}",
-                'Salary (EGP)': f"{report['salary']:.2f}"
-            })
-        
-        df = pd.DataFrame(data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        # Create summary table straight from the report dicts
+        df = pd.DataFrame.from_records(
+            reports, columns=list(_ALL_EMPLOYEES_COLUMNS)
+        ).rename(columns=_ALL_EMPLOYEES_COLUMNS)
+        money_cols = ['Expenses (EGP)', 'Bonus (EGP)', 'Salary (EGP)']
+        
+        # Money stays numeric: totals are one vectorized sum and the
+        # 2-decimal display is left to column_config
+        totals = df[money_cols].sum().to_dict()
+        
+        st.dataframe(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={col: st.column_config.NumberColumn(col, format="%.2f") for col in money_cols},
+        )
         
         # Summary totals
         st.markdown("---")
         st.subheader("💰 Totals")
         
-        total_salary = sum(r['salary'] for r in reports)
-        total_bonus = sum(r['bonus'] for r in reports)
-        total_expenses = sum(r['extra_expenses'] for r in reports)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Expenses", CurrencyHelper.format_currency(total_expenses))
-        with col2:
-            st.metric("Total Bonus", CurrencyHelper.format_currency(total_bonus))
-        with col3:
-            st.metric("Total Salary", CurrencyHelper.format_currency(total_salary))
+        metrics = (
+            ("Total Expenses", totals['Expenses (EGP)']),
+            ("Total Bonus", totals['Bonus (EGP)']),
+            ("Total Salary", totals['Salary (EGP)']),
+        )
+        for col, (label, amount) in zip(st.columns(len(metrics)), metrics):
+            col.metric(label, CurrencyHelper.format_currency(amount))
     
     
     def _render_add_employee(self):
@@ -936,7 +1431,7 @@ class AdminDashboard:
             with col2:
                 minute_cost = st.number_input("Minute Cost (EGP)*", min_value=0.0, value=5.0, step=0.5)
                 vacation_days = st.number_input("Vacation Days Allowed", min_value=0, value=21, step=1)
-                join_date = st.date_input("Join Date", value=date.today())
+                join_date = st.date_input("Join Date", value=self._today)
             
             submitted = st.form_submit_button("➕ Create Employee", type="primary")
             
@@ -956,6 +1451,7 @@ class AdminDashboard:
                     )
                     
                     if success:
+                        _clear_employee_caches()
                         st.success(f"✓ Employee '{full_name}' created successfully!")
                         st.info(f"Login credentials:\nUsername: {username}\nPassword: {password}")
                     else:
@@ -971,65 +1467,147 @@ class AdminDashboard:
         
         # Display date range info prominently
         st.success(f"✅ **You can add attendance for the last {days_back} days**")
-        st.info(f"📅 Date Range: **{min_date.strftime('%B %d, %Y')}** to **{max_date.strftime('%B %d, %Y')}**")
+        st.info(f"📅 Date Range: **{_format_long_date(min_date.toordinal())}** to **{_format_long_date(max_date.toordinal())}**")
         
         # Get all employees
-        employees = self.auth_service.get_all_employees()
+        employees, emp_labels, emp_options = _cached_employees_and_options(with_at=True)
         if not employees:
             st.warning("⚠️ No employees found. Please add employees first.")
             return
         
+        self._render_quick_add_form(emp_labels, emp_options, min_date, max_date)
+
+    def _submit_quick_add(self, nonce: int, emp_options: dict, min_date: date, max_date: date):
+        """
+        Create the attendance record entered in the quick-add form (submit callback).
+        
+        Reads the entry widgets from session state by key. On success the
+        nonce is rotated, so the rerun the submit triggers anyway renders
+        fresh, empty entry fields and the last-created panel.
+        
+        Args:
+            nonce: Current widget-key nonce of the entry fields
+            emp_options: Selectbox label -> user_id map
+            min_date: Earliest allowed attendance date
+            max_date: Latest allowed attendance date
+        """
+        state = st.session_state
+        # fix is part of branch: bug/fix_quick_add_attendance_react_issue
+        state.quick_add_success = None
+        
+        user_id = emp_options[state.qadd_employee]
+        attendance_date = state[f"qadd_date_{nonce}"]
+        day_type = state[f"qadd_daytype_{nonce}"]
+        check_in = state[f"qadd_checkin_{nonce}"]
+        check_out = state[f"qadd_checkout_{nonce}"]
+        
+        # Validate date is within range (double-check)
+        if not (min_date <= attendance_date <= max_date):
+            state.quick_add_error = f"Date must be between {min_date.isoformat()} and {max_date.isoformat()}"
+            return
+        
+        # ✅ FIX: Convert 00:00 to None (no check-in/out)
+        check_in_final = None if check_in == time(0, 0) else check_in
+        check_out_final = None if check_out == time(0, 0) else check_out
+        
+        # Create attendance record
+        success, attendance, msg = self.admin_service.create_attendance_record(
+            user_id, attendance_date, check_in_final, check_out_final, day_type
+        )
+        
+        if not success:
+            state.quick_add_error = msg
+            return
+        
+        _clear_report_caches()
+        # ✅ FIX: Store success info in session state
+        state.quick_add_success = {
+            'employee': _cached_employees_by_id()[user_id].full_name,
+            'date': attendance_date.isoformat(),
+            'day_type': day_type,
+            'check_in': check_in_final.isoformat(timespec='minutes') if check_in_final else 'N/A',
+            'check_out': check_out_final.isoformat(timespec='minutes') if check_out_final else 'N/A',
+            'message': msg
+        }
+        # Reset the entry fields by rotating their keys (employee choice is kept)
+        state.quick_add_form_nonce = nonce + 1
+    
+    @st.fragment
+    def _render_quick_add_form(self, emp_labels: tuple, emp_options: dict, min_date: date, max_date: date):
+        """
+        Render the quick-add form, its submission handling and the panels below it.
+        
+        Runs as a fragment so a submit reruns only this part of the page. The
+        record is created in the submit callback (_submit_quick_add), which
+        runs before that rerun, so no extra st.rerun() is needed to reset the
+        entry fields.
+        
+        Args:
+            emp_labels: Selectbox labels (cached tuple)
+            emp_options: Selectbox label -> user_id map
+            min_date: Earliest allowed attendance date
+            max_date: Latest allowed attendance date
+        """
+        days_back = (max_date - min_date).days
+        
         # ✅ FIX: Initialize session state for success tracking for the "quick add" form
         #part of branch: bug/fix_quick_add_attendance_react_issue
         if 'quick_add_success' not in st.session_state:
             st.session_state.quick_add_success = None
         
+        # Rotating the nonce gives the entry widgets fresh keys, which resets them
+        # after a successful add without clear_on_submit (employee choice is kept)
+        nonce = st.session_state.setdefault('quick_add_form_nonce', 0)
+        
         # Create form
-        with st.form("quick_add_attendance_form", clear_on_submit=True):
+        with st.form("quick_add_attendance_form"):
             st.subheader("📝 Attendance Entry")
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # Employee selection
-                emp_options = {f"{e.full_name} (@{e.username})": e.user_id for e in employees}
-                selected_emp = st.selectbox(
+                st.selectbox(
                     "Select Employee*",
-                    list(emp_options.keys()),
+                    emp_labels,
+                    key="qadd_employee",
                     help="Choose the employee for this attendance entry"
                 )
-                user_id = emp_options[selected_emp]
                 
                 # Date selection with validation
-                attendance_date = st.date_input(
+                st.date_input(
                     "Date*",
-                    value=date.today(),
+                    value=self._today,
                     min_value=min_date,
                     max_value=max_date,
+                    key=f"qadd_date_{nonce}",
                     help=f"Must be within the last {days_back} days"
                 )
                 
                 # Day type
-                day_type = st.selectbox(
+                st.selectbox(
                     "Day Type*",
-                    [dt.value for dt in DayType],
+                    _DAY_TYPE_VALUES,
+                    key=f"qadd_daytype_{nonce}",
                     help="Select the type of day"
                 )
             
             with col2:
                 # Check-in time
-                check_in = st.time_input(
+                st.time_input(
                     "Check-In Time",
                     #fix the valid time object issue - part of branch: bug/fix_quick_add_attendance_react_issue
                     value=time(0, 0),
+                    key=f"qadd_checkin_{nonce}",
                     help="Leave empty if employee didn't check in"
                 )
                 
                 # Check-out time
-                check_out = st.time_input(
+                st.time_input(
                     "Check-Out Time",
                     #fix the valid time object issue - part of branch: bug/fix_quick_add_attendance_react_issue
                     value=time(0, 0),
+                    key=f"qadd_checkout_{nonce}",
                     help="Leave empty if employee didn't check out"
                 )
                 
@@ -1037,63 +1615,48 @@ class AdminDashboard:
                 st.caption("💡 **Note:** Overtime and bonus are set separately in their dedicated sections")
                 st.caption("💡 **Time 00:00** means no check-in/out recorded")
             
-            # Submit button
-            submitted = st.form_submit_button("✅ Create Attendance Record", type="primary", use_container_width=True)
-            
-        # ✅ FIX: Process form submission OUTSIDE the form block
-        # fix is part of branch: bug/fix_quick_add_attendance_react_issue
-        if submitted:
-            # Validate date is within range (double-check)
-            if not (min_date <= attendance_date <= max_date):
-                st.error(f"❌ Date must be between {min_date.strftime('%Y-%m-%d')} and {max_date.strftime('%Y-%m-%d')}")
-            else:
-                # ✅ FIX: Convert 00:00 to None (no check-in/out)
-                check_in_final = None if check_in == time(0, 0) else check_in
-                check_out_final = None if check_out == time(0, 0) else check_out
-                
-                # Create attendance record
-                success, attendance, msg = self.admin_service.create_attendance_record(
-                    user_id, attendance_date, check_in_final, check_out_final, day_type
-                )
-                
-                if success:
-                    # ✅ FIX: Store success info in session state
-                    st.session_state.quick_add_success = {
-                        'employee': selected_emp.split('(')[0].strip(),
-                        'date': attendance_date.strftime('%Y-%m-%d'),
-                        'day_type': day_type,
-                        'check_in': check_in_final.strftime('%H:%M') if check_in_final else 'N/A',
-                        'check_out': check_out_final.strftime('%H:%M') if check_out_final else 'N/A'
-                    }
-                    st.success(f"✅ {msg}")
-                    # ✅ NO balloons or containers here - let rerun handle it
-                else:
-                    st.error(f"❌ {msg}")
-                    st.session_state.quick_add_success = None
+            # Submit button (the record is created in the callback, before the rerun)
+            st.form_submit_button(
+                "✅ Create Attendance Record",
+                type="primary",
+                use_container_width=True,
+                on_click=self._submit_quick_add,
+                args=(nonce, emp_options, min_date, max_date),
+            )
             
+        # Pre-allocated slot for the last-created panel
+        last_created_slot = st.empty()
+        
+        quick_add_error = st.session_state.pop('quick_add_error', None)
+        if quick_add_error:
+            st.error(f"❌ {quick_add_error}")
+        
         # ✅ FIX: Display success details OUTSIDE form processing (after rerun)
-        if st.session_state.quick_add_success:
-            # ✅ Show balloons only once (not on every rerun)
-            if not st.session_state.quick_add_success.get('balloons_shown', False):
+        last_created = st.session_state.quick_add_success
+        if last_created:
+            # ✅ Show balloons once per session (not on every record), so
+            # bulk backfill entry doesn't pay for the animation each time
+            if not st.session_state.get('quick_add_balloons_shown'):
                 st.balloons()
-                st.session_state.quick_add_success['balloons_shown'] = True
+                st.session_state.quick_add_balloons_shown = True
             
-            with st.expander("📋 Last Created Record (click to collapse)", expanded=True):
-                col_a, col_b, col_c = st.columns(3)
-                with col_a:
-                    st.metric("Employee", st.session_state.quick_add_success['employee'])
-                with col_b:
-                    st.metric("Date", st.session_state.quick_add_success['date'])
-                with col_c:
-                    st.metric("Day Type", st.session_state.quick_add_success['day_type'])
-                
-                col_d, col_e = st.columns(2)
-                with col_d:
-                    st.write(f"**Check-In:** {st.session_state.quick_add_success['check_in']}")
-                with col_e:
-                    st.write(f"**Check-Out:** {st.session_state.quick_add_success['check_out']}")
-                
-                st.caption("💡 This message will clear when you add another record")
+            # Whole panel goes into the slot as one success + one markdown
+            # element instead of columns/metrics rebuilt on every rerun
+            with last_created_slot.container():
+                st.success(f"✅ {last_created.get('message', 'Attendance record created')}")
+                if last_created['check_in'] == 'N/A' and last_created['check_out'] == 'N/A':
+                    # Nothing time-related to show (absence, vacation, ...): one line
+                    st.info(f"📋 Recorded **{last_created['day_type']}** for "
+                            f"**{last_created['employee']}** on {last_created['date']}")
+                else:
+                    st.markdown(
+                        "**📋 Last Created Record**\n\n"
+                        "| Employee | Date | Day Type | Check-In | Check-Out |\n"
+                        "|---|---|---|---|---|\n"
+                        f"| {last_created['employee']} | {last_created['date']} | {last_created['day_type']} "
+                        f"| {last_created['check_in']} | {last_created['check_out']} |\n\n"
+                        "💡 _This message will clear when you add another record_"
+                    )
             
             # Clear success state after displaying (or add a dismiss button)
             # if st.button("✅ Dismiss", key="dismiss_success"):
@@ -1101,25 +1664,62 @@ class AdminDashboard:
             #     st.rerun()
         
         # Show recent entries summary
+        self._render_recent_entries()
+
+    @st.fragment
+    def _render_recent_entries(self):
+        """
+        Render the current month's per-employee summary below the quick-add form.
+        
+        Runs as a fragment: its toggle and Refresh button rerun only this
+        panel, not the form above. Nothing is read until the admin asks for
+        the table (an expander would still execute its body on every rerun);
+        the data then comes from the cached all-employees report, which the
+        quick-add success path invalidates before its rerun.
+        """
         st.markdown("---")
-        st.subheader("📊 Recent Entries (Current Month)")
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.subheader("📊 Recent Entries (Current Month)")
+            show_entries = st.checkbox("Show current month summary", key="recent_entries_show")
+        with col2:
+            if show_entries and st.button("🔄 Refresh", key="recent_entries_refresh", use_container_width=True):
+                _cached_all_employees_report.clear()
+        
+        if not show_entries:
+            return
         
         # Get current month attendance for all employees
-        today = date.today()
-        all_reports = self.report_service.get_all_employees_report(today.year, today.month)
+        today = self._today
+        all_reports = _cached_all_employees_report(today.year, today.month)
         
         if all_reports:
-            summary_data = []
-            for report in all_reports:
-                summary_data.append({
-                    'Employee': report['user_name'],
-                    'Working Days': report['actual_working_days'],
-                    'Absence Days': report['absence_days'],
-                    'Total Hours': f"{report['working_hours']:.1f}"
-                })
+            # Reuse the last built frame while the underlying figures are unchanged
+            # (skips the DataFrame build + dtype conversion on unrelated reruns)
+            data_key = hash(tuple(
+                (r['user_name'], r['actual_working_days'], r['absence_days'], r['working_hours'])
+                for r in all_reports
+            ))
+            cached = st.session_state.get('recent_entries_cache')
+            if cached and cached[0] == data_key:
+                df = cached[1]
+            else:
+                df = _build_recent_entries_df(all_reports)
+                st.session_state.recent_entries_cache = (data_key, df)
+            
+            column_config = {
+                'Total Hours': st.column_config.NumberColumn('Total Hours', format="%.1f"),
+            }
+            
+            # Bound the per-rerun payload: top rows by default, the full
+            # roster only on demand
+            st.dataframe(df.head(_RECENT_ENTRIES_LIMIT), use_container_width=True, hide_index=True,
+                         column_config=column_config)
             
-            df = pd.DataFrame(summary_data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            if len(df) > _RECENT_ENTRIES_LIMIT:
+                with st.expander(f"Show all {len(df)} employees"):
+                    st.dataframe(df, use_container_width=True, hide_index=True,
+                                 column_config=column_config)
         else:
             st.info("ℹ️ No attendance records for current month yet")
 
@@ -1127,8 +1727,9 @@ class AdminDashboard:
     # The admin can change their own password or reset any employee's password without knowing their current password
     # this implementation is part of branch: feature/change_user_password
 
+    @st.fragment
     def _render_password_management(self):
-        """Render password management page for admin"""
+        """Render password management page for admin (fragment: form submits rerun only this page)"""
         st.header("🔐 Password Management")
         
         # Two tabs: Change own password & Reset employee password
@@ -1192,13 +1793,12 @@ class AdminDashboard:
             st.warning("⚠️ Admin privilege: Reset any employee's password without knowing their current password")
             
             # Select employee
-            employees = self.auth_service.get_all_employees()
+            employees, emp_labels, emp_options = _cached_employees_and_options(with_at=True)
             if not employees:
                 st.info("No employees found")
                 return
             
-            emp_options = {f"{e.full_name} (@{e.username})": e.user_id for e in employees}
-            selected_emp = st.selectbox("Select Employee*", list(emp_options.keys()))
+            selected_emp = st.selectbox("Select Employee*", emp_labels)
             user_id = emp_options[selected_emp]
             
             with st.form("admin_reset_password_form"):
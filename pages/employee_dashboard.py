@@ -23,7 +23,7 @@ from services.report_service import ReportService
 from services.calculation_service import CalculationService
 from services.auth_service import AuthService  # add this to auth-user using auth_service ➡️ part of feature/change_user_password
 from utils.helpers import TimeHelper, CurrencyHelper
-from utils.constants import SessionKeys, DayType
+from utils.constants import SessionKeys, DayType, UIConstants
 from utils.timezone_helper import get_current_cairo_datetime
 from utils.logger import get_logger
 
@@ -31,6 +31,39 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# ==================== Shared Services ====================
+@st.cache_resource
+def _get_services():
+    """
+    Create the employee services once per process and share them across reruns/users.
+    
+    The services keep no per-request state and every DB call opens its own
+    thread-local session through db_manager, so sharing needs no lock.
+    
+    Returns:
+        Tuple of (CheckinService, ReportService, CalculationService, AuthService)
+    """
+    logger.debug("Creating shared employee services")
+    return CheckinService(), ReportService(), CalculationService(), AuthService()
+
+
+# ==================== Cached Data Helpers ====================
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_monthly_report(user_id: int, year: int, month: int) -> dict:
+    """
+    Get an employee's monthly report keyed by (user_id, year, month) (cached for 30s).
+    
+    Cleared after check-in/check-out and comment/expense saves so the
+    statistics reflect the employee's own writes on the next rerun.
+    Attendance records are cached as plain AttendanceRow tuples, not
+    detached ORM objects.
+    """
+    report = _get_services()[1].get_monthly_report(user_id, year, month)
+    if report:
+        report['attendance_records'] = [r.to_row() for r in report['attendance_records']]
+    return report
+
+
 class EmployeeDashboard:
     """
     Employee dashboard interface.
@@ -43,11 +76,10 @@ class EmployeeDashboard:
     """
     
     def __init__(self):
-        """Initialize employee dashboard with required services"""
-        self.checkin_service = CheckinService()
-        self.report_service = ReportService()
-        self.calculator = CalculationService()
-        self.auth_service = AuthService()  # add this to auth-user using auth_service ➡️ part of feature/change_user_password
+        """Initialize employee dashboard with the shared (cached) services"""
+        # auth_service is used to auth-user ➡️ part of feature/change_user_password
+        (self.checkin_service, self.report_service,
+         self.calculator, self.auth_service) = _get_services()
         logger.debug("EmployeeDashboard initialized")
     
     def render(self):
@@ -148,7 +180,7 @@ class EmployeeDashboard:
             month = st.number_input("Month", min_value=1, max_value=12, value=cairo_today.month)
         
         # Get report
-        report = self.report_service.get_monthly_report(user_id, year, month)
+        report = _cached_monthly_report(user_id, int(year), int(month))
         
         if not report:
             st.info("No data available for this month")
@@ -260,12 +292,21 @@ class EmployeeDashboard:
                     'Working Days': summary['working_days'],
                     'Absence Days': summary['absence_days'],
                     'Total Hours': summary['working_hours'],
-                    'Bonus (EGP)': f"{summary['bonus']:.2f}",
-                    'Salary (EGP)': f"{summary['salary']:.2f}"
+                    'Bonus (EGP)': summary['bonus'],
+                    'Salary (EGP)': summary['salary']
                 })
             
+            # Money stays numeric; the 2-decimal display is done client-side
             df = pd.DataFrame(data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    col: st.column_config.NumberColumn(col, format="%.2f")
+                    for col in ('Bonus (EGP)', 'Salary (EGP)')
+                },
+            )
         else:
             st.info("No monthly data available")
 
@@ -365,7 +406,10 @@ class EmployeeDashboard:
                 success, attendance, message = self.checkin_service.check_in(user_id)
                 
                 if success:
-                    st.success(message)
+                    _cached_monthly_report.clear()
+                    # Toast survives the rerun that swaps in the check-out button
+                    # (an st.success here was wiped by st.rerun before it showed)
+                    st.toast(message, icon="✅")
                     logger.info(f"User {user_id} checked in successfully")
                     st.rerun()
                 else:
@@ -380,7 +424,8 @@ class EmployeeDashboard:
                     success, attendance, message = self.checkin_service.check_out(user_id)
                     
                     if success:
-                        st.success(message)
+                        _cached_monthly_report.clear()
+                        st.toast(message, icon="✅")
                         logger.info(f"User {user_id} checked out successfully")
                         st.rerun()
                     else:
@@ -471,8 +516,8 @@ class EmployeeDashboard:
             else:
                 overtime_str = "-"
             
-            # Format expenses
-            expenses = CurrencyHelper.format_currency(record.extra_expenses) if record.extra_expenses > 0 else "-"
+            # Expenses stay numeric (formatted client-side by column_config)
+            expenses = record.extra_expenses if record.extra_expenses > 0 else None
             
             # Day type badge
             day_type_display = record.day_type.replace('_', ' ').title()
@@ -481,7 +526,7 @@ class EmployeeDashboard:
             late_indicator = "🔴" if record.is_late else ""
             
             data.append({
-                'Date': record.attendance_date.strftime('%Y-%m-%d'),
+                'Date': record.attendance_date.isoformat(),
                 'Day': record.attendance_date.strftime('%A'),
                 'Check-In': f"{late_indicator} {check_in}" if late_indicator else check_in,
                 'Check-Out': check_out,
@@ -499,7 +544,10 @@ class EmployeeDashboard:
         st.dataframe(
             df,
             use_container_width=True,
-            hide_index=True
+            hide_index=True,
+            column_config={
+                'Expenses': st.column_config.NumberColumn('Expenses', format=f"%.2f {UIConstants.CURRENCY}"),
+            },
         )
         
         # Legend
@@ -552,11 +600,14 @@ class EmployeeDashboard:
             submitted = st.form_submit_button("💾 Save Information", type="primary")
             
             if submitted:
+                saved = False
+                
                 # Update comments
                 if comments != (attendance.comments or ""):
                     success, msg = self.checkin_service.add_comments(attendance.attendance_id, comments)
                     if success:
-                        st.success("Comments saved")
+                        saved = True
+                        st.toast("Comments saved", icon="✅")
                     else:
                         st.error(f"Failed to save comments: {msg}")
                 
@@ -564,12 +615,18 @@ class EmployeeDashboard:
                 if expenses != attendance.extra_expenses:
                     success, msg = self.checkin_service.add_extra_expenses(attendance.attendance_id, expenses)
                     if success:
-                        st.success("Expenses saved")
+                        saved = True
+                        st.toast("Expenses saved", icon="✅")
                     else:
                         st.error(f"Failed to save expenses: {msg}")
                 
-                if comments != (attendance.comments or "") or expenses != attendance.extra_expenses:
+                # Rerun only when something was written (the table above shows
+                # the saved values); a failed or no-op submit keeps its messages
+                if saved:
+                    _cached_monthly_report.clear()
                     st.rerun()
+                elif comments == (attendance.comments or "") and expenses == attendance.extra_expenses:
+                    st.info("ℹ️ No changes to save")
     
     def _render_monthly_statistics(self, user_id: int):
         """
@@ -582,7 +639,7 @@ class EmployeeDashboard:
         
         # Get current month report
         today = get_current_cairo_datetime().date()
-        report = self.report_service.get_monthly_report(user_id, today.year, today.month)
+        report = _cached_monthly_report(user_id, today.year, today.month)
         
         if not report:
             st.info("No data available for this month")
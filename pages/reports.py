@@ -28,6 +28,75 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# ==================== Shared Services ====================
+@st.cache_resource
+def _get_services():
+    """
+    Create the reports services once per process and share them across reruns/users.
+    
+    The services keep no per-request state and every DB call opens its own
+    thread-local session through db_manager, so sharing needs no lock.
+    
+    Returns:
+        Tuple of (ReportService, AuthService, CalculationService)
+    """
+    logger.debug("Creating shared reports services")
+    return ReportService(), AuthService(), CalculationService()
+
+
+# ==================== Cached Data Helpers ====================
+# Free functions with plain (hashable) args so st.cache_data can key on them;
+# the service itself comes from the process-wide cached resource above.
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_all_employees_report(year: int, month: int) -> list:
+    """
+    Get the monthly reports of all active employees keyed by (year, month) (cached for 30s).
+    
+    Invalidated explicitly on admin writes (clear_cached_reports); the short
+    TTL is a safety net for check-ins made in other sessions.
+    """
+    return _get_services()[0].get_all_employees_report(year, month)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_full_report(user_id: int) -> dict:
+    """Get an employee's full-history report keyed by user_id (cached for 300s)"""
+    return _get_services()[0].get_full_report(user_id)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_employee_options() -> tuple:
+    """
+    Get the employee selectbox labels and label -> user_id map (cached for 300s).
+    
+    The roster changes on the order of hours, so reruns read it from memory;
+    clear_cached_employees() invalidates it when employees are added/changed.
+    
+    Returns:
+        Tuple of (labels: tuple[str], options_map: dict)
+    """
+    employees = _get_services()[1].get_all_employees()
+    labels = tuple(f"{e.full_name} ({e.username})" for e in employees)
+    return labels, dict(zip(labels, (e.user_id for e in employees)))
+
+
+def clear_cached_employees():
+    """Invalidate the cached employee roster (called by the admin dashboard)"""
+    _cached_employee_options.clear()
+
+
+def clear_cached_reports():
+    """
+    Invalidate the reports page caches.
+    
+    Called by the admin dashboard after mutations that change salaries
+    or attendance, so the reports page never shows pre-edit totals.
+    """
+    _cached_all_employees_report.clear()
+    _cached_full_report.clear()
+
+
 class ReportsPage:
     """
     Reports page interface.
@@ -40,10 +109,8 @@ class ReportsPage:
     """
     
     def __init__(self):
-        """Initialize reports page with required services"""
-        self.report_service = ReportService()
-        self.auth_service = AuthService()
-        self.calculator = CalculationService()
+        """Initialize reports page with the shared (cached) services"""
+        self.report_service, self.auth_service, self.calculator = _get_services()
         logger.debug("ReportsPage initialized")
     
     def render(self):
@@ -155,14 +222,13 @@ class ReportsPage:
         """Render single employee monthly report for admin"""
         st.subheader("👤 Employee Monthly Report")
         
-        # Select employee
-        employees = self.auth_service.get_all_employees()
-        if not employees:
+        # Select employee (cached roster)
+        emp_labels, emp_options = _cached_employee_options()
+        if not emp_options:
             st.warning("No employees found")
             return
         
-        emp_options = {f"{e.full_name} ({e.username})": e.user_id for e in employees}
-        selected_emp = st.selectbox("Select Employee", list(emp_options.keys()))
+        selected_emp = st.selectbox("Select Employee", emp_labels)
         user_id = emp_options[selected_emp]
         
         # Month selector
@@ -180,14 +246,13 @@ class ReportsPage:
         """Render single employee full history for admin"""
         st.subheader("👤 Employee Full History")
         
-        # Select employee
-        employees = self.auth_service.get_all_employees()
-        if not employees:
+        # Select employee (cached roster)
+        emp_labels, emp_options = _cached_employee_options()
+        if not emp_options:
             st.warning("No employees found")
             return
         
-        emp_options = {f"{e.full_name} ({e.username})": e.user_id for e in employees}
-        selected_emp = st.selectbox("Select Employee", list(emp_options.keys()))
+        selected_emp = st.selectbox("Select Employee", emp_labels)
         user_id = emp_options[selected_emp]
         
         # Generate report
@@ -331,19 +396,24 @@ class ReportsPage:
                 late_flag = "🔴" if record.is_late else ""
                 
                 data.append({
-                    'Date': record.attendance_date.strftime('%Y-%m-%d'),
+                    'Date': record.attendance_date.isoformat(),
                     'Day': record.attendance_date.strftime('%A'),
                     'Check-In': f"{late_flag} {check_in}".strip(),
                     'Check-Out': check_out,
                     'Working Time': working_time,
                     'Overtime (min)': overtime_str,
-                    'Expenses (EGP)': f"{record.extra_expenses:.2f}" if record.extra_expenses > 0 else "-",
+                    'Expenses (EGP)': record.extra_expenses if record.extra_expenses > 0 else None,
                     'Type': record.day_type.replace('_', ' ').title(),
                     'Comments': record.comments if record.comments else "-"
                 })
             
             df = pd.DataFrame(data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={'Expenses (EGP)': st.column_config.NumberColumn('Expenses (EGP)', format="%.2f")},
+            )
             
             st.caption("🔴 = Late arrival (after 9:30 AM)")
         else:
@@ -359,7 +429,7 @@ class ReportsPage:
         logger.info(f"Displaying full report for user {user_id}")
         
         # Get report data
-        report = self.report_service.get_full_report(user_id)
+        report = _cached_full_report(user_id)
         
         if not report:
             st.error("No data available")
@@ -409,12 +479,20 @@ class ReportsPage:
                     'Total (min)': summary['total_minutes'],
                     'Overtime (min)': summary['overtime_minutes'],
                     'Min Price (EGP)': report['minute_cost'],
-                    'Bonus (EGP)': f"{summary['bonus']:.2f}",
-                    'Salary (EGP)': f"{summary['salary']:.2f}"
+                    'Bonus (EGP)': summary['bonus'],
+                    'Salary (EGP)': summary['salary']
                 })
             
+            # Numeric money columns (rounded for the CSV); display format via column_config
+            money_cols = ['Bonus (EGP)', 'Salary (EGP)']
             df = pd.DataFrame(data)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            df[money_cols] = df[money_cols].round(2)
+            st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                column_config={col: st.column_config.NumberColumn(col, format="%.2f") for col in money_cols},
+            )
             
             # Export option
             csv = df.to_csv(index=False)
@@ -437,8 +515,8 @@ class ReportsPage:
         """
         logger.info(f"Displaying all employees monthly report: {year}-{month:02d}")
         
-        # Get reports
-        reports = self.report_service.get_all_employees_report(year, month)
+        # Get reports (cached per (year, month) across reruns)
+        reports = _cached_all_employees_report(year, month)
         
         if not reports:
             st.error("No data available")
@@ -451,10 +529,6 @@ class ReportsPage:
         
         # Create summary table
         data = []
-        total_salary = 0
-        total_bonus = 0
-        total_expenses = 0
-        
         for report in reports:
             data.append({
                 'Employee': report['user_name'],
@@ -463,17 +537,24 @@ class ReportsPage:
                 'Hours': report['working_hours'],
                 'Minutes': report['working_minutes'],
                 'Overtime (min)': report['overtime_minutes'],
-                'Expenses (EGP)': f"{report['extra_expenses']:.2f}",
-                'Bonus (EGP)': f"{report['bonus']:.2f}",
-                'Salary (EGP)': f"{report['salary']:.2f}"
+                'Expenses (EGP)': report['extra_expenses'],
+                'Bonus (EGP)': report['bonus'],
+                'Salary (EGP)': report['salary']
             })
-            
-            total_salary += report['salary']
-            total_bonus += report['bonus']
-            total_expenses += report['extra_expenses']
         
+        # Money stays numeric (sortable); the column config formats it client-side
+        money_cols = ['Expenses (EGP)', 'Bonus (EGP)', 'Salary (EGP)']
         df = pd.DataFrame(data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        
+        # Totals in one vectorized pass over the unrounded columns
+        total_expenses, total_bonus, total_salary = df[money_cols].sum()
+        df[money_cols] = df[money_cols].round(2)
+        st.dataframe(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={col: st.column_config.NumberColumn(col, format="%.2f") for col in money_cols},
+        )
         
         # Totals summary
         st.markdown("---")
@@ -512,8 +593,8 @@ class ReportsPage:
         """
         logger.info(f"Displaying employee comparison: {year}-{month:02d}")
         
-        # Get reports
-        reports = self.report_service.get_all_employees_report(year, month)
+        # Get reports (cached per (year, month) across reruns)
+        reports = _cached_all_employees_report(year, month)
         
         if not reports:
             st.error("No data available")
@@ -524,26 +605,22 @@ class ReportsPage:
         month_name = self.calculator.get_month_name(month)
         st.header(f"📊 Employee Comparison - {month_name} {year}")
         
-        # Create comparison chart data
-        employee_names = [r['user_name'] for r in reports]
-        working_days = [r['actual_working_days'] for r in reports]
-        salaries = [r['salary'] for r in reports]
+        # One frame for both charts and the statistics (column-wise reductions)
+        chart_data = pd.DataFrame.from_records(
+            reports, columns=['user_name', 'actual_working_days', 'salary']
+        ).rename(columns={
+            'user_name': 'Employee',
+            'actual_working_days': 'Working Days',
+            'salary': 'Salary (EGP)',
+        }).set_index('Employee')
         
         # Working days comparison
         st.subheader("📅 Working Days Comparison")
-        chart_data = pd.DataFrame({
-            'Employee': employee_names,
-            'Working Days': working_days
-        })
-        st.bar_chart(chart_data.set_index('Employee'))
+        st.bar_chart(chart_data[['Working Days']])
         
         # Salary comparison
         st.subheader("💰 Salary Comparison")
-        chart_data = pd.DataFrame({
-            'Employee': employee_names,
-            'Salary (EGP)': salaries
-        })
-        st.bar_chart(chart_data.set_index('Employee'))
+        st.bar_chart(chart_data[['Salary (EGP)']])
         
         # Statistics
         st.subheader("📊 Statistics")
@@ -551,15 +628,15 @@ class ReportsPage:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            avg_working_days = sum(working_days) / len(working_days)
+            avg_working_days = chart_data['Working Days'].mean()
             st.metric("Average Working Days", f"{avg_working_days:.1f}")
         
         with col2:
-            avg_salary = sum(salaries) / len(salaries)
+            avg_salary = chart_data['Salary (EGP)'].mean()
             st.metric("Average Salary", CurrencyHelper.format_currency(avg_salary))
         
         with col3:
-            max_salary = max(salaries)
+            max_salary = chart_data['Salary (EGP)'].max()
             st.metric("Highest Salary", CurrencyHelper.format_currency(max_salary))
 
 
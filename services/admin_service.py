@@ -27,13 +27,17 @@ from database.db_manager import db_manager, DatabaseManager
 from database.models import Attendance, User, MonthlySummary, Holiday
 from services.calculation_service import CalculationService
 from services.report_service import ReportService
-from utils.constants import DayType, WorkHours
+from utils.constants import DAY_TYPE_VALUES, DayType, WorkHours
 from utils.validators import Validators
 from utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Valid day type values, built once at import (used for O(1) validation)
+_DAY_TYPE_VALUES = DAY_TYPE_VALUES
+_DAY_TYPE_SET = frozenset(_DAY_TYPE_VALUES)
+
 
 class AdminService:
     """
@@ -351,6 +355,77 @@ class AdminService:
             logger.error(f"Error updating daily adjustments: {e}")
             return False, f"Failed to update adjustments: {str(e)}"
 
+    def update_daily_adjustments_bulk(self,
+                                      adjustments: List[Tuple[int, int, float, Optional[str]]]) -> Tuple[bool, str]:
+        """
+        Update daily adjustments for many attendance records in one transaction.
+        
+        All rows are validated first, loaded with a single IN query and written
+        in one commit; each affected (user, month) summary is then recalculated
+        once instead of once per row.
+        
+        Args:
+            adjustments: List of (attendance_id, overtime_minutes, extra_expenses, comments)
+            
+        Returns:
+            Tuple of (success: bool, message: str). Nothing is written if any
+            row is invalid or missing.
+            
+        Example:
+            >>> admin.update_daily_adjustments_bulk([
+            ...     (123, 30, 50.0, "Client meeting, taxi"),
+            ...     (124, 0, 0.0, None),
+            ... ])
+        """
+        if not adjustments:
+            return True, "No changes to save"
+        
+        logger.info(f"Admin updating daily adjustments for {len(adjustments)} attendance records")
+        
+        # Validate every overtime value before touching the database
+        for attendance_id, overtime_minutes, _, _ in adjustments:
+            is_valid, error_msg = Validators.validate_overtime(overtime_minutes)
+            if not is_valid:
+                logger.warning(f"Invalid overtime value for attendance {attendance_id}: {error_msg}")
+                return False, error_msg
+        
+        try:
+            by_id = {attendance_id: values for attendance_id, *values in adjustments}
+            months_to_recalculate = set()
+            
+            with self.db.session_scope() as session:
+                records = session.query(Attendance).filter(
+                    Attendance.attendance_id.in_(by_id)
+                ).all()
+                
+                if len(records) != len(by_id):
+                    missing = set(by_id) - {r.attendance_id for r in records}
+                    logger.warning(f"Attendance records not found: {sorted(missing)}")
+                    return False, "Attendance record not found"
+                
+                now = datetime.utcnow()
+                for attendance in records:
+                    overtime_minutes, extra_expenses, comments = by_id[attendance.attendance_id]
+                    attendance.overtime_minutes = overtime_minutes
+                    attendance.extra_expenses = extra_expenses
+                    attendance.comments = comments
+                    attendance.updated_at = now
+                    months_to_recalculate.add((
+                        attendance.user_id,
+                        attendance.attendance_date.year,
+                        attendance.attendance_date.month,
+                    ))
+            
+            # Session closed - all rows committed together; recalculate each month once
+            for user_id, year, month in months_to_recalculate:
+                self._trigger_monthly_recalculation(user_id, year, month)
+            
+            return True, f"Saved adjustments for {len(records)} day(s)"
+        
+        except Exception as e:
+            logger.error(f"Error updating daily adjustments in bulk: {e}")
+            return False, f"Failed to update adjustments: {str(e)}"
+
 
     def update_bonus(self, user_id: int, year: int, month: int, bonus: float) -> Tuple[bool, str]:
         """
@@ -442,10 +517,9 @@ class AdminService:
         logger.info(f"Admin changing day type for attendance {attendance_id}: {day_type}")
         
         # Validate day type
-        valid_types = [dt.value for dt in DayType]
-        if day_type not in valid_types:
+        if day_type not in _DAY_TYPE_SET:
             logger.warning(f"Invalid day type: {day_type}")
-            return False, f"Invalid day type. Must be one of: {', '.join(valid_types)}"
+            return False, f"Invalid day type. Must be one of: {', '.join(_DAY_TYPE_VALUES)}"
         
         try:
             with self.db.session_scope() as session:
@@ -787,6 +861,62 @@ class AdminService:
             logger.error(f"Error adding holiday: {e}")
             return False, f"Failed to add holiday: {str(e)}"
     
+    def add_holidays_bulk(self,
+                          holidays: List[Tuple[date, str]],
+                          holiday_type: str = "public_holiday") -> Tuple[bool, str]:
+        """
+        Add several holidays to the calendar in one transaction.
+        
+        Existing dates are looked up with a single IN query and skipped
+        (as are repeated dates in the input); the rest are inserted together
+        and committed once.
+        
+        Args:
+            holidays: List of (holiday_date, holiday_name)
+            holiday_type: Type applied to every added holiday
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not holidays:
+            return False, "No holidays to add"
+        
+        logger.info(f"Admin adding {len(holidays)} holidays")
+        
+        try:
+            with self.db.session_scope() as session:
+                # First name wins for a date listed twice
+                by_date = {}
+                for holiday_date, holiday_name in holidays:
+                    by_date.setdefault(holiday_date, holiday_name)
+                
+                existing = {
+                    row.holiday_date for row in
+                    session.query(Holiday.holiday_date).filter(Holiday.holiday_date.in_(by_date))
+                }
+                
+                new_holidays = [
+                    Holiday(holiday_date=d, holiday_name=name, holiday_type=holiday_type)
+                    for d, name in sorted(by_date.items())
+                    if d not in existing
+                ]
+                
+                if not new_holidays:
+                    logger.warning("All submitted holidays already exist")
+                    return False, "All of these holidays already exist"
+                
+                session.add_all(new_holidays)
+                logger.info(f"Holidays added: {len(new_holidays)}, skipped existing: {len(existing)}")
+                
+                message = f"Added {len(new_holidays)} holiday(s)"
+                if existing:
+                    message += f"; skipped {len(existing)} already defined"
+                return True, message
+                
+        except Exception as e:
+            logger.error(f"Error adding holidays in bulk: {e}")
+            return False, f"Failed to add holidays: {str(e)}"
+    
     def remove_holiday(self, holiday_date: date) -> Tuple[bool, str]:
         """
         Remove a holiday from the calendar.
@@ -19,7 +19,9 @@ Usage:
 import bcrypt
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
+from sqlalchemy import select, lambda_stmt
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import undefer
 
 from database.db_manager import db_manager
 from database.models import User
@@ -33,6 +35,28 @@ from utils.timezone_helper import get_current_cairo_datetime #fix the issue to r
 logger = get_logger(__name__)
 
 
+# ==================== Cached Statements ====================
+def _user_by_username_stmt(username: str, with_password: bool = False):
+    """
+    Build the username lookup as a lambda statement.
+    
+    lambda_stmt caches the compiled SQL by code location and turns the
+    closed-over username into a bound parameter, so the hot login path
+    skips statement construction and compilation after the first call.
+    
+    Args:
+        username: Normalized username
+        with_password: Also load the deferred password_hash column
+        
+    Returns:
+        StatementLambdaElement ready for session.execute()
+    """
+    stmt = lambda_stmt(lambda: select(User).where(User.username == username))
+    if with_password:
+        stmt += lambda s: s.options(undefer(User.password_hash))
+    return stmt
+
+
 class AuthService:
     """
     Authentication and authorization service.
@@ -89,7 +113,9 @@ class AuthService:
             
             # Step 2: Query user from database
             with self.db.session_scope() as session:
-                user = session.query(User).filter_by(username=username).first()
+                user = session.execute(
+                    _user_by_username_stmt(username, with_password=True)
+                ).scalars().first()
                 
                 # Check if user exists
                 if not user:
@@ -195,7 +221,7 @@ class AuthService:
             # Step 2: Check if username already exists and employee limit
             with self.db.session_scope() as session:
                 # Check for duplicate username
-                existing_user = session.query(User).filter_by(username=username).first()
+                existing_user = session.execute(_user_by_username_stmt(username)).scalars().first()
                 if existing_user:
                     logger.warning(f"Username already exists: {username}")
                     return False, None, ValidationMessages.USER_ALREADY_EXISTS
@@ -387,7 +413,7 @@ class AuthService:
         
         try:
             with self.db.session_scope() as session:
-                user = session.query(User).filter_by(username=username).first()
+                user = session.execute(_user_by_username_stmt(username)).scalars().first()
                 
                 if user:
                     session.expunge(user)
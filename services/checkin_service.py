@@ -19,9 +19,10 @@ Usage:
 from datetime import datetime, date, time
 from typing import Optional, Tuple, List
 from sqlalchemy import and_
+from sqlalchemy.orm import undefer
 
 from database.db_manager import db_manager
-from database.models import Attendance, User
+from database.models import Attendance, User, period_key
 from services.calculation_service import CalculationService
 from utils.constants import DayType, ValidationMessages, LogMessages
 from utils.timezone_helper import get_current_cairo_datetime, get_current_cairo_date, get_current_cairo_time
@@ -270,7 +271,7 @@ class CheckinService:
             today = get_current_cairo_date()
             
             with self.db.session_scope() as session:
-                attendance = session.query(Attendance).filter(
+                attendance = session.query(Attendance).options(undefer(Attendance.comments)).filter(
                     and_(
                         Attendance.user_id == user_id,
                         Attendance.attendance_date == today
@@ -304,7 +305,7 @@ class CheckinService:
         
         try:
             with self.db.session_scope() as session:
-                attendance = session.query(Attendance).filter(
+                attendance = session.query(Attendance).options(undefer(Attendance.comments)).filter(
                     and_(
                         Attendance.user_id == user_id,
                         Attendance.attendance_date == attendance_date
@@ -335,20 +336,12 @@ class CheckinService:
         logger.debug(f"Fetching attendance for user {user_id} in {year}-{month:02d}")
         
         try:
-            # Calculate month boundaries
-            from datetime import timedelta
-            first_day = date(year, month, 1)
-            if month == 12:
-                last_day = date(year + 1, 1, 1) - timedelta(days=1)
-            else:
-                last_day = date(year, month + 1, 1) - timedelta(days=1)
-            
             with self.db.session_scope() as session:
-                records = session.query(Attendance).filter(
+                # Index seek on (user_id, period) instead of a date range scan
+                records = session.query(Attendance).options(undefer(Attendance.comments)).filter(
                     and_(
                         Attendance.user_id == user_id,
-                        Attendance.attendance_date >= first_day,
-                        Attendance.attendance_date <= last_day
+                        Attendance.period == period_key(year, month)
                     )
                 ).order_by(Attendance.attendance_date).all()
                 
@@ -18,10 +18,11 @@ Usage:
 
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
-from sqlalchemy import and_, func
+from sqlalchemy import and_, case, func, not_, or_
+from sqlalchemy.orm import undefer
 
 from database.db_manager import db_manager
-from database.models import Attendance, User, MonthlySummary, Holiday
+from database.models import Attendance, User, MonthlySummary, Holiday, period_key
 from services.calculation_service import CalculationService
 from utils.constants import DayType, TimeConstants, WorkHours 
 from utils.helpers import TimeHelper, CurrencyHelper
@@ -321,6 +322,15 @@ class ReportService:
         """
         Generate monthly reports for all employees.
         
+        Batched: one query for the active employees, one GROUP BY user_id
+        aggregate over the month's attendance (same counting rules as
+        get_monthly_report, expressed as CASE sums) and one transaction that
+        upserts every monthly summary. Round-trips no longer scale with
+        headcount.
+        
+        The per-employee dicts carry the same keys as get_monthly_report
+        except 'attendance_records' (use get_monthly_report for the rows).
+        
         Args:
             year: Year
             month: Month (1-12)
@@ -331,17 +341,16 @@ class ReportService:
         logger.info(f"Generating reports for all employees: {year}-{month:02d}")
         
         try:
-            # Get all active employees
+            # Get all active employees (only the columns the report needs)
             with self.db.session_scope() as session:
-                users = session.query(User).filter_by(is_active=True).all()
-                user_ids = [u.user_id for u in users]
+                users = session.query(
+                    User.user_id, User.full_name, User.minute_cost
+                ).filter_by(is_active=True).order_by(User.user_id).all()
             
-            # Generate report for each employee
-            reports = []
-            for user_id in user_ids:
-                report = self.get_monthly_report(user_id, year, month)
-                if report:
-                    reports.append(report)
+            if not users:
+                return []
+            
+            reports = self._build_month_reports(users, year, month)
             
             logger.info(f"Generated {len(reports)} employee reports")
             return reports
@@ -350,6 +359,39 @@ class ReportService:
             logger.error(f"Error generating all employees report: {e}")
             return []
     
+    def get_monthly_summaries_bulk(self, user_ids: List[int], year: int, month: int) -> Dict[int, Dict]:
+        """
+        Get the monthly figures of several employees in one batch.
+        
+        Same figures as get_monthly_report (minus 'attendance_records'),
+        computed with the set-based queries used by get_all_employees_report
+        instead of one report per employee.
+        
+        Args:
+            user_ids: User IDs to report on
+            year: Year
+            month: Month (1-12)
+            
+        Returns:
+            Dictionary of user_id -> monthly report dictionary
+        """
+        logger.info(f"Generating bulk monthly summaries for {len(user_ids)} users: {year}-{month:02d}")
+        
+        if not user_ids:
+            return {}
+        
+        try:
+            with self.db.session_scope() as session:
+                users = session.query(
+                    User.user_id, User.full_name, User.minute_cost
+                ).filter(User.user_id.in_(list(user_ids))).order_by(User.user_id).all()
+            
+            return {r['user_id']: r for r in self._build_month_reports(users, year, month)}
+            
+        except Exception as e:
+            logger.error(f"Error generating bulk monthly summaries: {e}")
+            return {}
+    
     def get_all_employees_full_report(self) -> List[Dict]:
         """
         Generate full reports for all employees.
@@ -379,6 +421,50 @@ class ReportService:
             logger.error(f"Error generating all employees full reports: {e}")
             return []
     
+    def get_attendance_between(self,
+                               user_id: int,
+                               start_date: date,
+                               end_date: date,
+                               fields: Tuple[str, ...] = ('attendance_id', 'attendance_date',
+                                                         'overtime_minutes', 'total_working_minutes')) -> List[Dict]:
+        """
+        Get a projection of a user's attendance rows in a half-open date range.
+        
+        Filters with a sargable `attendance_date >= :start AND attendance_date < :end`
+        predicate, so the (user_id, attendance_date) unique index serves
+        the lookup, and windows spanning two months come back in one query.
+        
+        Args:
+            user_id: User ID
+            start_date: First date to include
+            end_date: First date to exclude
+            fields: Attendance column names to return
+            
+        Returns:
+            List of {field: value} dictionaries ordered by attendance date
+        """
+        try:
+            columns = [Attendance.__table__.c[field] for field in fields]
+        except KeyError as e:
+            logger.error(f"Unknown attendance field requested: {e}")
+            return []
+        
+        try:
+            with self.db.session_scope() as session:
+                rows = session.query(*columns).filter(
+                    and_(
+                        Attendance.user_id == user_id,
+                        Attendance.attendance_date >= start_date,
+                        Attendance.attendance_date < end_date
+                    )
+                ).order_by(Attendance.attendance_date).all()
+                
+                return [dict(zip(fields, row)) for row in rows]
+                
+        except Exception as e:
+            logger.error(f"Error fetching attendance range: {e}")
+            return []
+    
     # ==================== Private Helper Methods ====================
     
     def _get_user(self, user_id: int) -> Optional[User]:
@@ -397,7 +483,7 @@ class ReportService:
         """Get attendance record for specific date"""
         try:
             with self.db.session_scope() as session:
-                attendance = session.query(Attendance).filter(
+                attendance = session.query(Attendance).options(undefer(Attendance.comments)).filter(
                     and_(
                         Attendance.user_id == user_id,
                         Attendance.attendance_date == attendance_date
@@ -412,21 +498,13 @@ class ReportService:
             return None
     
     def _get_attendance_for_month(self, user_id: int, year: int, month: int) -> List[Attendance]:
-        """Get all attendance records for a month"""
+        """Get all attendance records for a month (index seek on user_id + period)"""
         try:
-            # Calculate month boundaries
-            first_day = date(year, month, 1)
-            if month == 12:
-                last_day = date(year + 1, 1, 1) - timedelta(days=1)
-            else:
-                last_day = date(year, month + 1, 1) - timedelta(days=1)
-            
             with self.db.session_scope() as session:
-                records = session.query(Attendance).filter(
+                records = session.query(Attendance).options(undefer(Attendance.comments)).filter(
                     and_(
                         Attendance.user_id == user_id,
-                        Attendance.attendance_date >= first_day,
-                        Attendance.attendance_date <= last_day
+                        Attendance.period == period_key(year, month)
                     )
                 ).order_by(Attendance.attendance_date).all()
                 
@@ -504,6 +582,199 @@ class ReportService:
             logger.error(f"Error creating/updating monthly summary: {e}")
             return None
     
+    def _build_month_reports(self, users: list, year: int, month: int) -> List[Dict]:
+        """
+        Build monthly report dicts for many users with set-based queries.
+        
+        One GROUP BY aggregate over the month's attendance, one working-day
+        count and one summary upsert transaction, whatever the headcount.
+        
+        Args:
+            users: Rows with user_id, full_name and minute_cost
+            year: Year
+            month: Month (1-12)
+            
+        Returns:
+            List of monthly report dictionaries, in the order of users
+        """
+        totals = self._aggregate_month_attendance([u.user_id for u in users], year, month)
+        expected_working_days = self.calculator.get_working_days_in_month(year, month)
+        month_name = self.calculator.get_month_name(month)
+        
+        # Derive per-employee figures exactly like get_monthly_report
+        figures = {}
+        for user in users:
+            row = totals.get(user.user_id)
+            worked_days = row.worked_days if row else 0
+            leave_days = row.leave_days if row else 0
+            missed_days = row.missed_days if row else 0
+            
+            actual_working_days = worked_days + leave_days
+            total_working_minutes = ((row.worked_minutes if row else 0)
+                                     + leave_days * WorkHours.STANDARD_WORK_MINUTES)
+            figures[user.user_id] = {
+                'actual_working_days': actual_working_days,
+                'absence_days': max(0, expected_working_days - actual_working_days - missed_days),
+                'total_working_minutes': total_working_minutes,
+                'overtime_minutes': row.overtime_minutes if row else 0,
+                'extra_expenses': (row.expenses or 0.0) if row else 0.0,
+                'minute_cost': user.minute_cost,
+            }
+        
+        summaries = self._upsert_monthly_summaries(year, month, figures)
+        
+        reports = []
+        for user in users:
+            fig = figures[user.user_id]
+            summary = summaries.get(user.user_id)
+            working_hours, working_mins = self.calculator.format_minutes_to_hours_minutes(
+                fig['total_working_minutes']
+            )
+            reports.append({
+                'user_id': user.user_id,
+                'user_name': user.full_name,
+                'month': month,
+                'year': year,
+                'month_name': month_name,
+                'expected_working_days': expected_working_days,
+                'actual_working_days': fig['actual_working_days'],
+                'absence_days': fig['absence_days'],
+                'working_hours': working_hours,
+                'working_minutes': working_mins,
+                'total_working_minutes': fig['total_working_minutes'],
+                'overtime_minutes': fig['overtime_minutes'],
+                'minute_cost': user.minute_cost,
+                'bonus': summary.bonus if summary else 0.0,
+                'extra_expenses': fig['extra_expenses'],
+                'salary': summary.salary if summary else 0.0,
+            })
+        
+        return reports
+    
+    def _aggregate_month_attendance(self, user_ids: List[int], year: int, month: int) -> Dict:
+        """
+        Aggregate a month's attendance for many users in one GROUP BY query.
+        
+        Counting rules mirror get_monthly_report:
+        - worked: working day with both check-in and check-out
+        - missed: working day missing a check time, or an absence day
+        - leave: normal vacation / sick leave (credited standard minutes later)
+        
+        Returns:
+            Dictionary of user_id -> aggregate row
+        """
+        is_working = Attendance.day_type == DayType.WORKING_DAY.value
+        has_both_times = and_(
+            Attendance.check_in_time.isnot(None),
+            Attendance.check_out_time.isnot(None)
+        )
+        worked = and_(is_working, has_both_times)
+        missed = or_(
+            and_(is_working, not_(has_both_times)),
+            Attendance.day_type == DayType.ABSENCE.value
+        )
+        leave = Attendance.day_type.in_([DayType.NORMAL_VACATION.value, DayType.SICK_LEAVE.value])
+        
+        try:
+            with self.db.session_scope() as session:
+                rows = session.query(
+                    Attendance.user_id,
+                    func.sum(case((worked, 1), else_=0)).label('worked_days'),
+                    func.sum(case((leave, 1), else_=0)).label('leave_days'),
+                    func.sum(case((missed, 1), else_=0)).label('missed_days'),
+                    func.sum(case(
+                        (worked, func.coalesce(Attendance.total_working_minutes, 0)), else_=0
+                    )).label('worked_minutes'),
+                    func.sum(case(
+                        (worked, func.coalesce(Attendance.overtime_minutes, 0)), else_=0
+                    )).label('overtime_minutes'),
+                    func.sum(Attendance.extra_expenses).label('expenses'),
+                ).filter(
+                    and_(
+                        Attendance.user_id.in_(user_ids),
+                        Attendance.period == period_key(year, month)
+                    )
+                ).group_by(Attendance.user_id).all()
+                
+                return {row.user_id: row for row in rows}
+        except Exception as e:
+            logger.error(f"Error aggregating monthly attendance: {e}")
+            return {}
+    
+    def _upsert_monthly_summaries(self, year: int, month: int, figures: Dict[int, Dict]) -> Dict:
+        """
+        Create/update the monthly summaries of many users in one transaction.
+        
+        Same rules as _get_or_create_monthly_summary (bonus is preserved,
+        salary recalculated), but existing rows are loaded with a single
+        IN query and all writes share one flush/commit.
+        
+        Args:
+            year: Year
+            month: Month (1-12)
+            figures: user_id -> dict with actual_working_days, absence_days,
+                total_working_minutes, overtime_minutes, extra_expenses, minute_cost
+            
+        Returns:
+            Dictionary of user_id -> detached MonthlySummary
+        """
+        try:
+            with self.db.session_scope() as session:
+                existing = {
+                    s.user_id: s for s in session.query(MonthlySummary).filter(
+                        and_(
+                            MonthlySummary.user_id.in_(list(figures)),
+                            MonthlySummary.year == year,
+                            MonthlySummary.month == month
+                        )
+                    )
+                }
+                
+                summaries = {}
+                for user_id, fig in figures.items():
+                    hours, mins = self.calculator.format_minutes_to_hours_minutes(
+                        fig['total_working_minutes']
+                    )
+                    summary = existing.get(user_id)
+                    bonus = summary.bonus if summary else 0.0
+                    _, total_salary = self.calculator.calculate_monthly_salary(
+                        fig['total_working_minutes'], fig['overtime_minutes'],
+                        fig['minute_cost'], bonus, fig['extra_expenses']
+                    )
+                    
+                    if summary:
+                        # Note: bonus is NOT updated here - only admin can change it
+                        summary.working_days = fig['actual_working_days']
+                        summary.absence_days = fig['absence_days']
+                        summary.total_working_hours = hours
+                        summary.total_working_minutes = mins
+                        summary.overtime_minutes = fig['overtime_minutes']
+                        summary.salary = total_salary
+                    else:
+                        summary = MonthlySummary(
+                            user_id=user_id,
+                            year=year,
+                            month=month,
+                            working_days=fig['actual_working_days'],
+                            absence_days=fig['absence_days'],
+                            total_working_hours=hours,
+                            total_working_minutes=mins,
+                            overtime_minutes=fig['overtime_minutes'],
+                            bonus=0.0,  # Default bonus is 0, admin sets it
+                            salary=total_salary
+                        )
+                        session.add(summary)
+                    summaries[user_id] = summary
+                
+                session.flush()
+                for summary in summaries.values():
+                    session.expunge(summary)
+                return summaries
+                
+        except Exception as e:
+            logger.error(f"Error upserting monthly summaries: {e}")
+            return {}
+    
     def _get_all_monthly_summaries(self, user_id: int) -> List[MonthlySummary]:
         """Get all monthly summaries for a user"""
         try:
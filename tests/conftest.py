@@ -0,0 +1,43 @@
+"""
+Shared pytest setup.
+
+Points the application at a throwaway SQLite file before any project module
+is imported (Config and the db_manager singleton read DATABASE_URL at import
+time), and provides a fixture that hands each test an empty database file.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_TEST_DIR = tempfile.mkdtemp(prefix="simple_checkin_tests_")
+TEST_DB_PATH = os.path.join(_TEST_DIR, "test.db")
+
+os.environ["ENVIRONMENT"] = "development"
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_PATH}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def empty_db():
+    """
+    Give the test an empty SQLite file at the configured DATABASE_URL.
+    
+    The shared StaticPool connection is disposed before and after, so the
+    engine reconnects to the fresh file instead of a deleted one.
+    
+    Yields:
+        str: Path of the SQLite database file
+    """
+    from database.db_manager import db_manager
+    
+    db_manager.engine.dispose()
+    if os.path.exists(TEST_DB_PATH):
+        os.remove(TEST_DB_PATH)
+    
+    yield TEST_DB_PATH
+    
+    db_manager.engine.dispose()
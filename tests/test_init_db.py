@@ -0,0 +1,174 @@
+"""
+Tests for database/init_db.py migrations on legacy SQLite databases.
+"""
+
+import sqlite3
+from datetime import date
+
+from database import init_db
+from database.init_db import DatabaseInitializer, MONEY_MIGRATION_VERSION
+from database.db_manager import db_manager
+
+
+def _execute_script(db_path: str, script: str):
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(script)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _fetch_one(db_path: str, sql: str):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql).fetchone()
+    finally:
+        conn.close()
+
+
+# ==================== Money Migration ====================
+
+LEGACY_MONEY_SCHEMA = """
+    CREATE TABLE users (user_id INTEGER PRIMARY KEY, minute_cost REAL);
+    CREATE TABLE attendance (attendance_id INTEGER PRIMARY KEY, extra_expenses REAL);
+    CREATE TABLE monthly_summary (summary_id INTEGER PRIMARY KEY, bonus REAL, salary REAL);
+    INSERT INTO users VALUES (1, 1.5);
+    INSERT INTO attendance VALUES (1, 25.5);
+    INSERT INTO monthly_summary VALUES (1, 100.25, 860.75);
+"""
+
+
+def test_migrate_money_columns_scales_every_legacy_real_column(empty_db):
+    _execute_script(empty_db, LEGACY_MONEY_SCHEMA)
+    
+    assert DatabaseInitializer().migrate_money_columns() == 4
+    db_manager.engine.dispose()
+    
+    assert _fetch_one(empty_db, "SELECT minute_cost FROM users") == (15000,)
+    assert _fetch_one(empty_db, "SELECT extra_expenses FROM attendance") == (2550,)
+    assert _fetch_one(empty_db, "SELECT bonus, salary FROM monthly_summary") == (10025, 86075)
+    assert _fetch_one(empty_db, "PRAGMA user_version") == (MONEY_MIGRATION_VERSION,)
+
+
+def test_migrate_money_columns_runs_only_once(empty_db):
+    _execute_script(empty_db, LEGACY_MONEY_SCHEMA)
+    
+    initializer = DatabaseInitializer()
+    initializer.migrate_money_columns()
+    assert initializer.migrate_money_columns() == 0
+    db_manager.engine.dispose()
+    
+    assert _fetch_one(empty_db, "SELECT minute_cost FROM users") == (15000,)
+
+
+# ==================== Natural Key Rebuild ====================
+
+LEGACY_KEYS_SCHEMA = """
+    CREATE TABLE users (user_id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT);
+    CREATE TABLE monthly_summary (
+        summary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL REFERENCES users(user_id),
+        month INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        working_days INTEGER DEFAULT 0,
+        absence_days INTEGER DEFAULT 0,
+        total_working_hours INTEGER DEFAULT 0,
+        total_working_minutes INTEGER DEFAULT 0,
+        overtime_minutes INTEGER DEFAULT 0,
+        bonus INTEGER DEFAULT 0,
+        salary INTEGER DEFAULT 0,
+        created_at TIMESTAMP,
+        UNIQUE(user_id, month, year)
+    );
+    CREATE TABLE holidays (
+        holiday_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        holiday_date DATE UNIQUE NOT NULL,
+        holiday_name TEXT NOT NULL,
+        holiday_type TEXT DEFAULT 'public_holiday',
+        created_at TIMESTAMP
+    );
+    INSERT INTO users VALUES (1, 'ahmed');
+    INSERT INTO monthly_summary (user_id, month, year, working_days, bonus, salary)
+        VALUES (1, 3, 2025, 21, 10025, 860075);
+    INSERT INTO holidays (holiday_date, holiday_name) VALUES ('2025-01-07', 'Coptic Christmas');
+    PRAGMA user_version = 1;
+"""
+
+
+def _table_info(db_path: str, table: str) -> dict:
+    """PRAGMA table_info as {column name: pk position (0 = not in the key)}"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[1]: row[5] for row in conn.execute(f"PRAGMA table_info({table})")}
+    finally:
+        conn.close()
+
+
+def test_migrate_natural_keys_rebuilds_legacy_tables(empty_db):
+    _execute_script(empty_db, LEGACY_KEYS_SCHEMA)
+    
+    assert DatabaseInitializer().migrate_natural_keys() == 2
+    db_manager.engine.dispose()
+    
+    summary_columns = _table_info(empty_db, "monthly_summary")
+    assert "summary_id" not in summary_columns
+    assert (summary_columns["user_id"], summary_columns["year"], summary_columns["month"]) == (1, 2, 3)
+    
+    holiday_columns = _table_info(empty_db, "holidays")
+    assert "holiday_id" not in holiday_columns
+    assert holiday_columns["holiday_date"] == 1
+    
+    for table in ("monthly_summary", "holidays"):
+        create_sql = _fetch_one(empty_db, f"SELECT sql FROM sqlite_master WHERE name = '{table}'")[0]
+        assert "WITHOUT ROWID" in create_sql
+    
+    assert _fetch_one(
+        empty_db, "SELECT working_days, bonus, salary FROM monthly_summary WHERE user_id = 1"
+    ) == (21, 10025, 860075)
+    assert _fetch_one(empty_db, "SELECT holiday_name FROM holidays") == ("Coptic Christmas",)
+    assert _fetch_one(empty_db, "PRAGMA user_version") == (2,)
+    
+    # Guarded by user_version: a second run does nothing
+    assert DatabaseInitializer().migrate_natural_keys() == 0
+
+
+# ==================== Seed Dump ====================
+
+def test_seed_sql_matches_models():
+    with open(init_db.SEED_SQL, encoding="utf-8") as f:
+        committed = f.read()
+    
+    # Regenerate with: python database/init_db.py --dump-seed
+    assert committed == init_db.build_seed_sql()
+
+
+def test_restored_seed_dump_is_migrated_and_seeded(empty_db):
+    assert init_db.restore_seed_dump()
+    assert not DatabaseInitializer().has_users()
+    
+    assert DatabaseInitializer().initialize_database(
+        create_admin=True, seed_holidays=True, holiday_year=date.today().year
+    )
+    db_manager.engine.dispose()
+    
+    assert _fetch_one(empty_db, "PRAGMA user_version") == (init_db.SCHEMA_VERSION,)
+    assert _fetch_one(empty_db, "SELECT username FROM users") == ("admin",)
+    assert _fetch_one(empty_db, "SELECT MIN(holiday_date) FROM holidays") == (f"{date.today().year}-01-01",)
+
+
+def test_restore_seed_dump_skips_other_schema_versions(empty_db, tmp_path, monkeypatch):
+    stale_dump = tmp_path / "seed.sql"
+    stale_dump.write_text(init_db.build_seed_sql().replace(
+        f"{init_db.SEED_VERSION_MARKER}{init_db.SCHEMA_VERSION}\n",
+        f"{init_db.SEED_VERSION_MARKER}{init_db.SCHEMA_VERSION - 1}\n",
+    ), encoding="utf-8")
+    monkeypatch.setattr(init_db, "SEED_SQL", str(stale_dump))
+    
+    assert not init_db.restore_seed_dump()
+
+
+def test_restore_seed_dump_leaves_existing_database_alone(empty_db):
+    _execute_script(empty_db, LEGACY_MONEY_SCHEMA)
+    
+    assert not init_db.restore_seed_dump()
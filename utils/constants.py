@@ -22,6 +22,11 @@ class DayType(Enum):
     ABSENCE = "absence"
 
 
+# DayType values in declaration order, built once at import (selectbox
+# choices and O(1) validation instead of re-iterating the enum per call)
+DAY_TYPE_VALUES = tuple(dt.value for dt in DayType)
+
+
 class SessionKeys(Enum):
     """Session storage keys"""
     USER_ID = "user_id"
@@ -4,6 +4,7 @@ Provides utility functions used throughout the application.
 """
 
 from datetime import datetime, date, time, timedelta
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import calendar
 
@@ -178,10 +179,14 @@ class CurrencyHelper:
     """Currency formatting helpers"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_currency(amount: float) -> str:
         """
         Format amount as currency.
         
+        Memoized: the output is a pure function of the amount and the
+        same totals are formatted on every rerun.
+        
         Args:
             amount: Amount to format
             